@@ -5,6 +5,17 @@
 ALGORITHM = 'ga'  # aco, ga, pso, graank, acolcm, lcm, prs, pls
 MIN_SUPPORT = 0.5
 CPU_CORES = 4  # Depends on your computer
+CACHE_DIR = None  # directory of preprocessed data sets (None: no cache)
+BIN_TYPE = 'auto'  # support backend: auto, packed, dense, memmap, lazy, rank, blocked, sampled (auto: see MEM_BUDGET)
+APPROXIMATE = False  # estimate supports on sampled tuple pairs (same as BIN_TYPE = 'sampled')
+RE_VERIFY = False  # exact supports of the final patterns (approximate mode)
+COMPRESS = False  # keep identical rows once, with their multiplicity (not with LCM)
+MEM_BUDGET = None  # e.g. '4G': bin type chosen to fit if BIN_TYPE is 'auto' (None: no budget)
+CHUNK_ROWS = None  # read the CSV file this many rows at a time (None: whole file)
+COLUMNS = None  # e.g. '0,3,Age': only these columns (indices or header names) are mined
+MERGE_DT = False  # add each Time column to the Date column before it (one date-time attribute)
+WINDOW = None  # graank: patterns of the last WINDOW rows of the stream (None: whole data set)
+CROSS_CHECK = False  # compare the supports of the mined patterns across all backends
 
 # DATASET = "../../data/DATASET.csv"
 # DATASET = "../../data/hcv_data.csv"
@@ -8,8 +8,21 @@ Usage:
     $python init_acograd.py -f ../data/DATASET.csv -s 0.5
 
 Description:
-    f -> file path (CSV)
+    f -> file path (CSV, or a columnar data set directory)
     s -> minimum support
+    d -> cache directory of preprocessed data sets
+    b -> support backend (bin type): auto, packed, dense, memmap, lazy, rank, blocked or sampled
+    x -> approximate supports (sampled tuple pairs), same as -b sampled
+    r -> re-verify the final patterns with exact supports
+    z -> compress identical rows (not with lcm or acolcm)
+    m -> memory budget (chooses the bin type with -b auto, checks it otherwise)
+    k -> rows per chunk when reading the CSV file
+    l -> columns to mine (indices or header names)
+    g -> merge each Time column into the Date column before it
+    w -> write the CSV file as a columnar data set directory (and exit)
+    n -> (graank) mine a sliding window of the last n rows (rank bins unless -b is given); new patterns
+         appear each time the window is mined again, every n rows, and are tracked row by row in between
+    y -> cross-check the supports of the (graank) patterns across all backends
 
 """
 
@@ -18,6 +31,8 @@ from optparse import OptionParser
 import config as cfg
 from pkg_algorithms import aco_grad_v4, ga_grad, pls_grad, prs_grad, pso_grad
 from pkg_algorithms import graank_v2, aco_lcm, lcm_gp
+from pkg_algorithms.shared.dataset_bfs import Dataset
+from pkg_algorithms.shared.mem_planner import BIN_TYPES
 
 
 if __name__ == "__main__":
@@ -30,6 +45,18 @@ if __name__ == "__main__":
         pcVal = sys.argv[5]
         vFactor = sys.argv[6]
         stepVal = sys.argv[7]
+        cacheDir = cfg.CACHE_DIR
+        binType = cfg.BIN_TYPE
+        approx = cfg.APPROXIMATE
+        verify = cfg.RE_VERIFY
+        compress = cfg.COMPRESS
+        memBudget = cfg.MEM_BUDGET
+        chunkRows = cfg.CHUNK_ROWS
+        columns = cfg.COLUMNS
+        mergeDt = cfg.MERGE_DT
+        columnsDir = None
+        window = cfg.WINDOW
+        crossCheck = cfg.CROSS_CHECK
     else:
         optparser = OptionParser()
         optparser.add_option('-a', '--algorithmChoice',
@@ -72,8 +99,77 @@ if __name__ == "__main__":
                              help='step size (PLS)',
                              default=cfg.STEP_SIZE,
                              type='float')
+        optparser.add_option('-d', '--cacheDir',
+                             dest='cacheDir',
+                             help='cache directory of preprocessed data sets',
+                             default=cfg.CACHE_DIR,
+                             type='string')
+        optparser.add_option('-b', '--binType', '--backend',
+                             dest='binType',
+                             help='support backend: ' + ', '.join(['auto'] + BIN_TYPES),
+                             default=cfg.BIN_TYPE,
+                             choices=(['auto'] + BIN_TYPES),
+                             type='choice')
+        optparser.add_option('-x', '--approximate',
+                             dest='approx',
+                             help='estimate supports on sampled tuple pairs',
+                             default=cfg.APPROXIMATE,
+                             action='store_true')
+        optparser.add_option('-r', '--reverify',
+                             dest='verify',
+                             help='exact supports of the final patterns (approximate mode)',
+                             default=cfg.RE_VERIFY,
+                             action='store_true')
+        optparser.add_option('-z', '--compress',
+                             dest='compress',
+                             help='keep identical rows once, with their multiplicity',
+                             default=cfg.COMPRESS,
+                             action='store_true')
+        optparser.add_option('-m', '--memBudget', '--mem-budget',
+                             dest='memBudget',
+                             help='memory budget (e.g. 4G): -b auto takes the fastest bin type that fits it, '
+                                  'other bin types must fit it',
+                             default=cfg.MEM_BUDGET,
+                             type='string')
+        optparser.add_option('-k', '--chunkRows',
+                             dest='chunkRows',
+                             help='read the CSV file this many rows at a time',
+                             default=cfg.CHUNK_ROWS,
+                             type='int')
+        optparser.add_option('-l', '--columns',
+                             dest='columns',
+                             help='comma-separated indices or header names of the columns to mine',
+                             default=cfg.COLUMNS,
+                             type='string')
+        optparser.add_option('-g', '--mergeDateTime',
+                             dest='mergeDt',
+                             help='add each Time column to the Date column before it',
+                             default=cfg.MERGE_DT,
+                             action='store_true')
+        optparser.add_option('-w', '--writeColumns',
+                             dest='columnsDir',
+                             help='write the CSV file as a columnar data set to this directory',
+                             default=None,
+                             type='string')
+        optparser.add_option('-n', '--window',
+                             dest='window',
+                             help='(graank) patterns of a sliding window of the last n rows, with rank bins (O(n) '
+                                  'memory) unless -b is given. The window is mined again every n rows: new '
+                                  'patterns appear then, and mined patterns are tracked row by row in between',
+                             default=cfg.WINDOW,
+                             type='int')
+        optparser.add_option('-y', '--crossCheck',
+                             dest='crossCheck',
+                             help='compare the supports of the mined patterns across all backends',
+                             default=cfg.CROSS_CHECK,
+                             action='store_true')
         (options, args) = optparser.parse_args()
 
+        if options.compress and options.algChoice in ('lcm', 'acolcm'):
+            optparser.error('-z (compress) is not supported by lcm and acolcm: their supports depend on the '
+                            'order of the rows')
+        if options.window and (options.verify or options.compress):
+            optparser.error('-r (reverify) and -z (compress) are not supported with -n (window)')
         if options.file is None:
             print("Usage: $python3 main.py -a 'aco' -f filename.csv ")
             sys.exit('System will exit')
@@ -86,6 +182,38 @@ if __name__ == "__main__":
         pcVal = options.pcVal
         vFactor = options.vFactor
         stepVal = options.stepVal
+        cacheDir = options.cacheDir
+        binType = options.binType
+        approx = options.approx
+        verify = options.verify
+        compress = options.compress
+        memBudget = options.memBudget
+        chunkRows = options.chunkRows
+        columns = options.columns
+        mergeDt = options.mergeDt
+        columnsDir = options.columnsDir
+        window = options.window
+        crossCheck = options.crossCheck
+
+    if columnsDir:
+        Dataset.write_columns(filePath, columnsDir, merge_dt=mergeDt, chunk_rows=chunkRows)
+        print("Columnar data set written to " + columnsDir)
+        sys.exit(0)
+
+    binType = 'sampled' if approx else binType
+    attributes = columns.split(',') if columns else None
+
+    if crossCheck:
+        # patterns are mined (GRAANK) with one backend, then counted by all of them
+        d_set, list_gp = graank_v2.graank(filePath, minSup, bin_type=binType, cache_dir=cacheDir, compress=compress,
+                                          chunk_rows=chunkRows, attributes=attributes, merge_dt=mergeDt)
+        supports, mismatches = d_set.cross_check(list_gp)
+        print("Cross-check of " + str(len(list_gp)) + " patterns (" + binType + "): " + ', '.join(supports.keys()))
+        for gp, b_type, supp, exact_supp in mismatches:
+            print(str(gp.to_string()) + ' : ' + b_type + ' ' + str(round(supp, 3)) + ' (exact ' +
+                  str(round(exact_supp, 3)) + ')')
+        print("Backends agree" if len(mismatches) == 0 else (str(len(mismatches)) + " disagreements"))
+        sys.exit(0 if len(mismatches) == 0 else 1)
 
     VISUAL = [0, 0, 0]
     if cfg.SHOW_P_MATRIX:
@@ -104,7 +232,8 @@ if __name__ == "__main__":
         start = time.time()
         tracemalloc.start()
         res_text = aco_grad_v4.execute(filePath, minSup, numCores, eVal, cfg.MAX_ITERATIONS, cfg.MAX_EVALUATIONS,
-                                       VISUAL)
+                                       VISUAL, binType, cacheDir, verify, compress, memBudget, chunkRows, attributes,
+                                       mergeDt)
         snapshot = tracemalloc.take_snapshot()
         end = time.time()
 
@@ -119,7 +248,8 @@ if __name__ == "__main__":
         start = time.time()
         tracemalloc.start()
         res_text = ga_grad.execute(filePath, minSup, numCores, cfg.MAX_ITERATIONS, cfg.MAX_EVALUATIONS,
-                                   cfg.N_POPULATION, pcVal, cfg.GAMMA, cfg.MU, cfg.SIGMA, cfg.N_VAR, VISUAL)
+                                   cfg.N_POPULATION, pcVal, cfg.GAMMA, cfg.MU, cfg.SIGMA, cfg.N_VAR, VISUAL,
+                                   binType, cacheDir, verify, compress, memBudget, chunkRows, attributes, mergeDt)
         snapshot = tracemalloc.take_snapshot()
         end = time.time()
 
@@ -134,7 +264,9 @@ if __name__ == "__main__":
         start = time.time()
         tracemalloc.start()
         res_text = pso_grad.execute(filePath, minSup, numCores, cfg.MAX_ITERATIONS, cfg.MAX_EVALUATIONS,
-                                    cfg.N_PARTICLES, vFactor, cfg.PERSONAL_COEFF, cfg.GLOBAL_COEFF, cfg.N_VAR, VISUAL)
+                                    cfg.N_PARTICLES, vFactor, cfg.PERSONAL_COEFF, cfg.GLOBAL_COEFF, cfg.N_VAR, VISUAL,
+                                    binType, cacheDir, verify, compress, memBudget, chunkRows, attributes,
+                                    mergeDt)
         snapshot = tracemalloc.take_snapshot()
         end = time.time()
 
@@ -148,7 +280,9 @@ if __name__ == "__main__":
         # GRAANK
         start = time.time()
         tracemalloc.start()
-        res_text = graank_v2.init(filePath, minSup, numCores)
+        res_text = graank_v2.init(filePath, minSup, numCores, bin_type=binType, cache_dir=cacheDir, verify=verify,
+                                  compress=compress, mem_budget=memBudget, chunk_rows=chunkRows,
+                                  attributes=attributes, window=window, merge_dt=mergeDt)
         snapshot = tracemalloc.take_snapshot()
         end = time.time()
 
@@ -162,7 +296,7 @@ if __name__ == "__main__":
         # ACO-LCM
         start = time.time()
         tracemalloc.start()
-        res_text = aco_lcm.init(filePath, minSup, eVal, numCores)
+        res_text = aco_lcm.init(filePath, minSup, eVal, numCores, memBudget, chunkRows, attributes, mergeDt)
         snapshot = tracemalloc.take_snapshot()
         end = time.time()
 
@@ -176,7 +310,7 @@ if __name__ == "__main__":
         # LCM
         start = time.time()
         tracemalloc.start()
-        res_text = lcm_gp.init(filePath, minSup, numCores)
+        res_text = lcm_gp.init(filePath, minSup, numCores, memBudget, chunkRows, attributes, mergeDt)
         snapshot = tracemalloc.take_snapshot()
         end = time.time()
 
@@ -191,7 +325,8 @@ if __name__ == "__main__":
         start = time.time()
         tracemalloc.start()
         res_text = prs_grad.execute(filePath, minSup, numCores, cfg.MAX_ITERATIONS, cfg.MAX_EVALUATIONS, cfg.N_VAR,
-                                    VISUAL)
+                                    VISUAL, binType, cacheDir, verify, compress, memBudget, chunkRows, attributes,
+                                    mergeDt)
         snapshot = tracemalloc.take_snapshot()
         end = time.time()
 
@@ -206,7 +341,8 @@ if __name__ == "__main__":
         start = time.time()
         tracemalloc.start()
         res_text = pls_grad.execute(filePath, minSup, numCores, cfg.MAX_ITERATIONS, cfg.MAX_EVALUATIONS, stepVal,
-                                    cfg.N_VAR, VISUAL)
+                                    cfg.N_VAR, VISUAL, binType, cacheDir, verify, compress, memBudget, chunkRows,
+                                    attributes, mergeDt)
         snapshot = tracemalloc.take_snapshot()
         end = time.time()
 
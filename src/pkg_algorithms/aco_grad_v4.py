@@ -45,17 +45,20 @@ def generate_d(valid_bins):
                 bin_1 = v_bins[i][1]
                 bin_2 = v_bins[j][1]
                 # Cumulative sum of all segments for 2x2 (all attributes) gradual items
-                d[i][j] += np.sum(np.multiply(bin_1, bin_2))
+                d[i][j] += bin_1.count_and(bin_2)
     # print(d)
     return d, attr_keys
 
 
-def run_ant_colony(f_path, min_supp, evaporation_factor, max_iteration, max_evaluations):
+def run_ant_colony(f_path, min_supp, evaporation_factor, max_iteration, max_evaluations, bin_type='auto', n_jobs=1,
+                   cache_dir=None, verify=False, compress=False, mem_budget=None, chunk_rows=None, attributes=None,
+                   merge_dt=False):
     global max_evals
     max_evals = max_evaluations
 
     # 0. Initialize and prepare data set
-    d_set = Dataset(f_path, min_supp)
+    d_set = Dataset(f_path, min_supp, bin_type=bin_type, n_jobs=n_jobs, cache_dir=cache_dir, merge_dt=merge_dt,
+                    compress=compress, mem_budget=mem_budget, chunk_rows=chunk_rows, attributes=attributes)
     d_set.init_gp_attributes()
     d, attr_keys = generate_d(d_set.valid_bins)  # distance matrix (d) & attributes corresponding to d
 
@@ -133,6 +136,10 @@ def run_ant_colony(f_path, min_supp, evaporation_factor, max_iteration, max_eval
             pass
         it_count += 1
 
+    # Exact supports of the final patterns (approximate mode)
+    if verify:
+        winner_gps = d_set.verify_patterns(winner_gps)
+
     # Output
     out = structure()
     out.best_costs = best_cost_arr
@@ -145,6 +152,7 @@ def run_ant_colony(f_path, min_supp, evaporation_factor, max_iteration, max_eval
     out.titles = d_set.titles
     out.col_count = d_set.col_count
     out.row_count = d_set.row_count
+    out.supp_error = d_set.supp_error
     out.e_factor = evaporation_factor
     out.p_matrix = pheromones
     return out
@@ -188,17 +196,7 @@ def update_pheromones(attr_keys, pattern, p_matrix):
 
 
 def cost_func(d_set, pattern):
-    temp_bin = np.array([])
-    for gi in pattern.gradual_items:
-        arg = np.argwhere(np.isin(d_set.valid_bins[:, 0], gi.gradual_item))
-        if len(arg) > 0:
-            i = arg[0][0]
-            valid_bin = d_set.valid_bins[i]
-            if temp_bin.size <= 0:
-                temp_bin = valid_bin[1].copy()
-            else:
-                temp_bin = np.multiply(temp_bin, valid_bin[1])
-    bin_sum = np.sum(temp_bin)
+    bin_sum = d_set.count_pairs(pattern.gradual_items)
     if bin_sum > 0:
         cost = (1 / bin_sum)
     else:
@@ -214,31 +212,7 @@ def cost_func(d_set, pattern):
 
 def validate_gp(d_set, pattern):
     # pattern = [('2', '+'), ('4', '+')]
-    min_supp = d_set.thd_supp
-    n = d_set.attr_size
-    gen_pattern = GP()
-    bin_arr = np.array([])
-
-    for gi in pattern.gradual_items:
-        arg = np.argwhere(np.isin(d_set.valid_bins[:, 0], gi.gradual_item))
-        if len(arg) > 0:
-            i = arg[0][0]
-            valid_bin = d_set.valid_bins[i]
-            if bin_arr.size <= 0:
-                bin_arr = np.array([valid_bin[1], valid_bin[1]])
-                gen_pattern.add_gradual_item(gi)
-            else:
-                bin_arr[1] = valid_bin[1].copy()
-                temp_bin = np.multiply(bin_arr[0], bin_arr[1])
-                supp = float(np.sum(temp_bin)) / float(n * (n - 1.0) / 2.0)
-                if supp >= min_supp:
-                    bin_arr[0] = temp_bin.copy()
-                    gen_pattern.add_gradual_item(gi)
-                    gen_pattern.set_support(supp)
-    if len(gen_pattern.gradual_items) <= 1:
-        return pattern
-    else:
-        return gen_pattern
+    return d_set.validate_pattern(pattern)
 
 
 def check_anti_monotony(lst_p, pattern, subset=True):
@@ -272,14 +246,17 @@ def is_duplicate(pattern, lst_winners, lst_losers):
     return False
 
 
-def execute(f_path, min_supp, cores,  evaporation_factor, max_iteration, max_evaluations, visuals):
+def execute(f_path, min_supp, cores,  evaporation_factor, max_iteration, max_evaluations, visuals, bin_type='auto',
+            cache_dir=None, verify=False, compress=False, mem_budget=None, chunk_rows=None, attributes=None,
+            merge_dt=False):
     try:
         if cores > 1:
             num_cores = cores
         else:
             num_cores = Profile.get_num_cores()
 
-        out = run_ant_colony(f_path, min_supp, evaporation_factor, max_iteration, max_evaluations)
+        out = run_ant_colony(f_path, min_supp, evaporation_factor, max_iteration, max_evaluations, bin_type, num_cores,
+                             cache_dir, verify, compress, mem_budget, chunk_rows, attributes, merge_dt)
         list_gp = out.best_patterns
 
         # Results
@@ -302,11 +279,12 @@ def execute(f_path, min_supp, cores,  evaporation_factor, max_iteration, max_eva
             except AttributeError:
                 wr_line += (str(txt[0]) + '. ' + str(txt[1].decode()) + '\n')
 
-        wr_line += str("\nFile: " + f_path + '\n')
+        wr_line += str("\nFile: " + Dataset.get_source_name(f_path) + '\n')
         wr_line += str("\nPattern : Support" + '\n')
 
+        supp_error = '' if out.supp_error <= 0 else (' +/- ' + str(round(out.supp_error, 3)))
         for gp in list_gp:
-            wr_line += (str(gp.to_string()) + ' : ' + str(round(gp.support, 3)) + '\n')
+            wr_line += (str(gp.to_string()) + ' : ' + str(round(gp.support, 3)) + supp_error + '\n')
 
         if visuals[0]:
             wr_line += "\nPheromone Matrix\n"
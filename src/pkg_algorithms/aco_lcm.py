@@ -25,14 +25,16 @@ from .shared.profile import Profile
 
 class LcmACO(LcmGP):
 
-    def __init__(self, f_path, min_supp, evaporation_factor, n_jobs=1):
+    def __init__(self, f_path, min_supp, evaporation_factor, n_jobs=1, mem_budget=None, chunk_rows=None,
+                 attributes=None, merge_dt=False):
         # super().__init__(file, min_supp, n_jobs)
         print("LcmACO: Version 1.0")
         self.min_supp = min_supp  # provided by user
         self._min_supp = LcmGP.check_min_supp(self.min_supp)
         self.n_jobs = n_jobs  # n_jobs
 
-        self.d_set = DatasetDFS(f_path, min_supp, eq=False)
+        self.d_set = DatasetDFS(f_path, min_supp, eq=False, mem_budget=mem_budget,
+                                chunk_rows=chunk_rows, attributes=attributes, merge_dt=merge_dt)
         self.D = self.d_set.remove_inv_attrs(self.d_set.encode_data())
         self.size = self.d_set.attr_size
         self.c_matrix = np.ones((self.size, self.size), dtype=np.float64)
@@ -58,11 +60,10 @@ class LcmACO(LcmGP):
         # 2. reduce data set
         if isinstance(self.min_supp, float):
             # make support absolute if needed
-            self._min_supp = self.min_supp * self.size
+            self._min_supp = self.min_supp * self.d_set.row_count
 
         low_supp_items = [k for k, v in item_to_tids.items()
-                          if len(np.unique(np.array(list(v))[:, 0], axis=0))
-                          < self._min_supp]
+                          if self.d_set.count_tuples(v) < self._min_supp]
         for item in low_supp_items:
             del item_to_tids[item]
 
@@ -165,14 +166,15 @@ class LcmACO(LcmGP):
         return pat
 
 
-def init(f_path, min_supp, e_factor, cores):
+def init(f_path, min_supp, e_factor, cores, mem_budget=None, chunk_rows=None, attributes=None, merge_dt=False):
     try:
         if cores > 1:
             num_cores = cores
         else:
             num_cores = Profile.get_num_cores()
 
-        ac = LcmACO(f_path, min_supp, e_factor, n_jobs=num_cores)
+        ac = LcmACO(f_path, min_supp, e_factor, n_jobs=num_cores, mem_budget=mem_budget,
+                    chunk_rows=chunk_rows, attributes=attributes, merge_dt=merge_dt)
         lst_gp = ac.run_ant_colony()
 
         d_set = ac.d_set
@@ -189,7 +191,7 @@ def init(f_path, min_supp, e_factor, cores):
             except AttributeError:
                 wr_line += (str(txt[0]) + '. ' + str(txt[1].decode()) + '\n')
 
-        wr_line += str("\nFile: " + f_path + '\n')
+        wr_line += str("\nFile: " + DatasetDFS.get_source_name(f_path) + '\n')
         wr_line += str("\nPattern : Support" + '\n')
 
         for gp in lst_gp:
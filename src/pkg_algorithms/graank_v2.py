@@ -7,12 +7,13 @@
 
 """
 
-import numpy as np
 import gc
 
 from .shared.fuzzy_mf import calculate_time_lag
 from .shared.dataset_bfs import Dataset
 from .shared.gp import GI, GP, TGP
+from .shared.sliding_window import SlidingWindow
+from .shared.mem_planner import MemPlanner
 from .shared.profile import Profile
 
 
@@ -24,7 +25,8 @@ def inv(g_item):
     return temp
 
 
-def gen_apriori_candidates(R, sup, n):
+def gen_apriori_candidates(R, sup, n, max_bytes=None):
+    # max_bytes: memory for the candidate bins of R and of the next level (MemoryError beyond it)
     res = []
     I = []
     if len(R) < 2:
@@ -33,6 +35,8 @@ def gen_apriori_candidates(R, sup, n):
         Ck = [{x[0]} for x in R]
     except TypeError:
         Ck = [set(x[0]) for x in R]
+    # bins of single items are not candidates
+    cand_bytes = sum(x[1].nbytes for x in R) if len(Ck[0]) > 1 else 0
 
     for i in range(len(R) - 1):
         for j in range(i + 1, len(R)):
@@ -60,36 +64,46 @@ def gen_apriori_candidates(R, sup, n):
                         test = 0
                         break
                 if test == 1:
-                    m = R[i][1] * R[j][1]
-                    t = float(np.sum(m)) / float(n * (n - 1.0) / 2.0)
+                    m = R[i][1] & R[j][1]
+                    t = float(m.count()) / float(n * (n - 1.0) / 2.0)
                     if t > sup:
                         res.append([temp, m])
+                        cand_bytes += m.nbytes
+                        if (max_bytes is not None) and (cand_bytes > max_bytes):
+                            raise MemoryError('candidate bins need more than ' + MemPlanner.format_size(max_bytes) +
+                                              ', the memory left by the memory budget')
                 I.append(temp)
                 gc.collect()
     return res
 
 
-def graank(f_path=None, min_sup=None, eq=False, t_diffs=None, d_set=None):
+def graank(f_path=None, min_sup=None, eq=False, t_diffs=None, d_set=None, bin_type='auto', n_jobs=1, cache_dir=None,
+           verify=False, compress=False, mem_budget=None, chunk_rows=None, attributes=None, merge_dt=False):
     if d_set is None:
-        d_set = Dataset(f_path, min_sup, eq)
+        d_set = Dataset(f_path, min_sup, eq, bin_type, n_jobs=n_jobs, cache_dir=cache_dir, compress=compress,
+                        mem_budget=mem_budget, chunk_rows=chunk_rows, attributes=attributes, merge_dt=merge_dt,
+                        apriori=True)
         d_set.init_gp_attributes()
     else:
         d_set = d_set
         min_sup = d_set.thd_supp
+    if (t_diffs is not None) and (d_set.bin_type == 'sampled'):
+        # time lags are computed from the binary matrix of a pattern, which a sampled bin does not have
+        raise Exception("T-GRAANK needs the binary matrices of patterns: bin_type 'sampled' is not supported")
     patterns = []
     n = d_set.attr_size
     # lst_valid_gi = gen_valid_bins(d_set.invalid_bins, d_set.attr_cols)
     valid_bins = d_set.valid_bins
 
     while len(valid_bins) > 0:
-        valid_bins = gen_apriori_candidates(valid_bins, min_sup, n)
+        valid_bins = gen_apriori_candidates(valid_bins, min_sup, n, d_set.cand_bytes)
         i = 0
         while i < len(valid_bins) and valid_bins != []:
             gi_tuple = valid_bins[i][0]
             bin_data = valid_bins[i][1]
             # grp = 'dataset/' + d_set.step_name + '/valid_bins/' + gi.as_string()
             # bin_data = d_set.read_h5_dataset(grp)
-            sup = float(np.sum(np.array(bin_data))) / float(n * (n - 1.0) / 2.0)
+            sup = float(bin_data.count()) / float(n * (n - 1.0) / 2.0)
             if sup < min_sup:
                 del valid_bins[i]
             else:
@@ -100,7 +114,7 @@ def graank(f_path=None, min_sup=None, eq=False, t_diffs=None, d_set=None):
                     else:
                         z = z + 1
                 if t_diffs is not None:
-                    t_lag = calculate_time_lag(bin_data, t_diffs)
+                    t_lag = calculate_time_lag(bin_data.unpack(), t_diffs)
                     if t_lag.valid:
                         gp = GP()
                         for obj in valid_bins[i][0]:
@@ -117,24 +131,68 @@ def graank(f_path=None, min_sup=None, eq=False, t_diffs=None, d_set=None):
                     gp.set_support(sup)
                     patterns.append(gp)
                 i += 1
+    if verify and (t_diffs is None):
+        # exact supports of the final patterns (approximate mode)
+        patterns = d_set.verify_patterns(patterns)
     if t_diffs is None:
         return d_set, patterns
     else:
         return patterns
 
 
-def init(f_path, min_supp, cores, eq=False):
+def graank_stream(rows, min_sup, window, attr_cols, eq=False, refresh=None, bin_type='auto', n_jobs=1,
+                  mem_budget=None):
+    # gradual patterns of the last window rows, after every row of rows. Tracked patterns are updated
+    # in O(window) per row; the window is mined again (new patterns, with bins of bin_type: rank if 'auto')
+    # every refresh rows
+    s_win = SlidingWindow(window, min_sup, attr_cols, eq, refresh, bin_type, n_jobs, mem_budget)
+    for row in rows:
+        if s_win.push(row):
+            w_set = s_win.get_dataset()
+            w_set.init_gp_attributes()
+            s_win.track_patterns(graank(d_set=w_set)[1])
+        yield s_win
+
+
+def graank_window(f_path, min_sup, window, eq=False, refresh=None, chunk_rows=None, attributes=None, merge_dt=False,
+                  bin_type='auto', n_jobs=1, cache_dir=None, mem_budget=None):
+    # streams the rows of a data set through a sliding window; returns the data set and the last window.
+    # cache_dir caches the parsed data set; mem_budget holds each mined window
+    d_set = Dataset(f_path, min_sup, eq, cache_dir=cache_dir, chunk_rows=chunk_rows, attributes=attributes,
+                    merge_dt=merge_dt)
+    window = min(window, d_set.row_count)  # a shorter data set is mined as one window
+    s_win = None
+    for s_win in graank_stream((d_set.data[i] for i in range(d_set.row_count)), min_sup, window,
+                               d_set.attr_cols, eq, refresh, bin_type, n_jobs, mem_budget):
+        pass
+    return d_set, s_win
+
+
+def init(f_path, min_supp, cores, eq=False, bin_type='auto', cache_dir=None, verify=False, compress=False,
+         mem_budget=None, chunk_rows=None, attributes=None, window=None, refresh=None, merge_dt=False):
     try:
-        d_set, list_gp = graank(f_path, min_supp, eq)
-
         if cores > 1:
             num_cores = cores
         else:
             num_cores = Profile.get_num_cores()
 
+        if window:
+            if verify or compress:
+                # patterns of a window are tracked exactly, over its rows in arrival order
+                raise Exception("a sliding window supports neither verify nor compress")
+            d_set, s_win = graank_window(f_path, min_supp, window, eq, refresh, chunk_rows, attributes, merge_dt,
+                                         bin_type, num_cores, cache_dir, mem_budget)
+            list_gp = s_win.get_patterns()
+        else:
+            d_set, list_gp = graank(f_path, min_supp, eq, bin_type=bin_type, n_jobs=num_cores, cache_dir=cache_dir,
+                                    verify=verify, compress=compress, mem_budget=mem_budget,
+                                    chunk_rows=chunk_rows, attributes=attributes, merge_dt=merge_dt)
+
         wr_line = "Algorithm: GRAANK \n"
         wr_line += "No. of (dataset) attributes: " + str(d_set.col_count) + '\n'
         wr_line += "No. of (dataset) tuples: " + str(d_set.row_count) + '\n'
+        if window:
+            wr_line += "Window (last tuples): " + str(s_win.size) + '\n'
         wr_line += "Minimum support: " + str(min_supp) + '\n'
         wr_line += "Number of cores: " + str(num_cores) + '\n'
         wr_line += "Number of patterns: " + str(len(list_gp)) + '\n\n'
@@ -142,11 +200,12 @@ def init(f_path, min_supp, cores, eq=False):
         for txt in d_set.titles:
             wr_line += (str(txt[0]) + '. ' + str(txt[1].decode()) + '\n')
 
-        wr_line += str("\nFile: " + f_path + '\n')
+        wr_line += str("\nFile: " + Dataset.get_source_name(f_path) + '\n')
         wr_line += str("\nPattern : Support" + '\n')
 
+        supp_error = '' if d_set.supp_error <= 0 else (' +/- ' + str(round(d_set.supp_error, 3)))
         for gp in list_gp:
-            wr_line += (str(gp.to_string()) + ' : ' + str(gp.support) + '\n')
+            wr_line += (str(gp.to_string()) + ' : ' + str(gp.support) + supp_error + '\n')
 
         return wr_line
     except ArithmeticError as error:
@@ -9,7 +9,6 @@ Modified by: Dickson Owuor <owuordickson@ieee.org>
 
 """
 
-import numpy as np
 from collections import defaultdict
 from sortedcontainers import SortedDict
 import gc
@@ -22,7 +21,7 @@ from .shared.profile import Profile
 
 class LcmGP:
 
-    def __init__(self, file, min_supp=0.5, n_jobs=1):  # , verbose=False):
+    def __init__(self, file, min_supp=0.5, n_jobs=1, mem_budget=None, chunk_rows=None, attributes=None, merge_dt=False):
         self.min_supp = min_supp  # provided by user
         self._min_supp = LcmGP.check_min_supp(self.min_supp)
         self.item_to_tids = None
@@ -31,7 +30,8 @@ class LcmGP:
         self.n_jobs = n_jobs
         # self.verbose = verbose
 
-        self.d_set = DatasetDFS(file, min_supp, eq=False)
+        self.d_set = DatasetDFS(file, min_supp, eq=False, mem_budget=mem_budget,
+                                chunk_rows=chunk_rows, attributes=attributes, merge_dt=merge_dt)
         self.D = self.d_set.remove_inv_attrs(self.d_set.encode_data())
         self._fit()
 
@@ -49,10 +49,9 @@ class LcmGP:
 
         if isinstance(self.min_supp, float):
             # make support absolute if needed
-            self._min_supp = self.min_supp * self.d_set.attr_size
+            self._min_supp = self.min_supp * self.d_set.row_count
 
-        low_supp_items = [k for k, v in item_to_tids.items() if
-                          len(np.unique(np.array(list(v))[:, 0], axis=0)) < self._min_supp]
+        low_supp_items = [k for k, v in item_to_tids.items() if self.d_set.count_tuples(v) < self._min_supp]
         for item in low_supp_items:
             del item_to_tids[item]
 
@@ -126,12 +125,7 @@ class LcmGP:
                     yield from self._inner(p_prime, new_limit_tids, new_limit)
 
     def calculate_support(self, tids):
-        if len(tids) > 1:
-            x = np.unique(np.array(list(tids))[:, 0], axis=0)
-            supp = len(x) / self.d_set.attr_size
-            return supp
-        else:
-            return len(tids) / self.d_set.attr_size
+        return self.d_set.count_tuples(tids) / self.d_set.row_count
 
     @staticmethod
     def check_min_supp(min_supp, accept_absolute=True):
@@ -150,14 +144,15 @@ class LcmGP:
         return min_supp
 
 
-def init(f_path, min_supp, cores):
+def init(f_path, min_supp, cores, mem_budget=None, chunk_rows=None, attributes=None, merge_dt=False):
     try:
         if cores > 1:
             num_cores = cores
         else:
             num_cores = Profile.get_num_cores()
 
-        lcm = LcmGP(f_path, min_supp, n_jobs=num_cores)
+        lcm = LcmGP(f_path, min_supp, n_jobs=num_cores, mem_budget=mem_budget,
+                    chunk_rows=chunk_rows, attributes=attributes, merge_dt=merge_dt)
         lst_gp = lcm.fit_discover()
 
         d_set = lcm.d_set
@@ -171,7 +166,7 @@ def init(f_path, min_supp, cores):
         for txt in d_set.titles:
             wr_line += (str(txt[0]) + '. ' + str(txt[1].decode()) + '\n')
 
-        wr_line += str("\nFile: " + f_path + '\n')
+        wr_line += str("\nFile: " + DatasetDFS.get_source_name(f_path) + '\n')
         wr_line += str("\nPattern : Support" + '\n')
 
         for obj in lst_gp:
@@ -27,9 +27,12 @@ from .shared.profile import Profile
 
 
 # hill climbing local search algorithm
-def run_hill_climbing(f_path, min_supp, max_iteration, max_evaluations, step_size, nvar):
+def run_hill_climbing(f_path, min_supp, max_iteration, max_evaluations, step_size, nvar, bin_type='auto', n_jobs=1,
+                      cache_dir=None, verify=False, compress=False, mem_budget=None, chunk_rows=None, attributes=None,
+                      merge_dt=False):
     # Prepare data set
-    d_set = Dataset(f_path, min_supp)
+    d_set = Dataset(f_path, min_supp, bin_type=bin_type, n_jobs=n_jobs, cache_dir=cache_dir, merge_dt=merge_dt,
+                    compress=compress, mem_budget=mem_budget, chunk_rows=chunk_rows, attributes=attributes)
     d_set.init_gp_attributes()
     attr_keys = [GI(x[0], x[1].decode()).as_string() for x in d_set.valid_bins[:, 0]]
     attr_keys_spl = [attr_keys[x:x + 2] for x in range(0, len(attr_keys), 2)]
@@ -95,7 +98,11 @@ def run_hill_climbing(f_path, min_supp, max_iteration, max_evaluations, step_siz
             pass
         it_count += 1
 
-        # Output
+    # Exact supports of the final patterns (approximate mode)
+    if verify:
+        best_patterns = d_set.verify_patterns(best_patterns)
+
+    # Output
     out = structure()
     out.best_sol = best_sol
     out.best_costs = best_costs
@@ -109,22 +116,13 @@ def run_hill_climbing(f_path, min_supp, max_iteration, max_evaluations, step_siz
     out.titles = d_set.titles
     out.col_count = d_set.col_count
     out.row_count = d_set.row_count
+    out.supp_error = d_set.supp_error
     return out
 
 
 def cost_func(position, attr_keys, d_set):
     pattern = decode_gp(attr_keys, position)
-    temp_bin = np.array([])
-    for gi in pattern.gradual_items:
-        arg = np.argwhere(np.isin(d_set.valid_bins[:, 0], gi.gradual_item))
-        if len(arg) > 0:
-            i = arg[0][0]
-            valid_bin = d_set.valid_bins[i]
-            if temp_bin.size <= 0:
-                temp_bin = valid_bin[1].copy()
-            else:
-                temp_bin = np.multiply(temp_bin, valid_bin[1])
-    bin_sum = np.sum(temp_bin)
+    bin_sum = d_set.count_pairs(pattern.gradual_items)
     if bin_sum > 0:
         cost = (1 / bin_sum)
     else:
@@ -154,33 +152,8 @@ def decode_gp(attr_keys, gene):
 
 
 def validate_gp(d_set, pattern):
-
     # pattern = [('2', '+'), ('4', '+')]
-    min_supp = d_set.thd_supp
-    n = d_set.attr_size
-    gen_pattern = GP()
-    bin_arr = np.array([])
-
-    for gi in pattern.gradual_items:
-        arg = np.argwhere(np.isin(d_set.valid_bins[:, 0], gi.gradual_item))
-        if len(arg) > 0:
-            i = arg[0][0]
-            valid_bin = d_set.valid_bins[i]
-            if bin_arr.size <= 0:
-                bin_arr = np.array([valid_bin[1], valid_bin[1]])
-                gen_pattern.add_gradual_item(gi)
-            else:
-                bin_arr[1] = valid_bin[1].copy()
-                temp_bin = np.multiply(bin_arr[0], bin_arr[1])
-                supp = float(np.sum(temp_bin)) / float(n * (n - 1.0) / 2.0)
-                if supp >= min_supp:
-                    bin_arr[0] = temp_bin.copy()
-                    gen_pattern.add_gradual_item(gi)
-                    gen_pattern.set_support(supp)
-    if len(gen_pattern.gradual_items) <= 1:
-        return pattern
-    else:
-        return gen_pattern
+    return d_set.validate_pattern(pattern)
 
 
 def check_anti_monotony(lst_p, pattern, subset=True):
@@ -210,14 +183,17 @@ def is_duplicate(pattern, lst_winners):
     return False
 
 
-def execute(f_path, min_supp, cores, max_iteration, max_evaluations, step_size, nvar, visuals):
+def execute(f_path, min_supp, cores, max_iteration, max_evaluations, step_size, nvar, visuals, bin_type='auto',
+            cache_dir=None, verify=False, compress=False, mem_budget=None, chunk_rows=None, attributes=None,
+            merge_dt=False):
     try:
         if cores > 1:
             num_cores = cores
         else:
             num_cores = Profile.get_num_cores()
 
-        out = run_hill_climbing(f_path, min_supp, max_iteration, max_evaluations, step_size, nvar)
+        out = run_hill_climbing(f_path, min_supp, max_iteration, max_evaluations, step_size, nvar, bin_type, num_cores,
+                                cache_dir, verify, compress, mem_budget, chunk_rows, attributes, merge_dt)
         list_gp = out.best_patterns
 
         # Results
@@ -240,11 +216,12 @@ def execute(f_path, min_supp, cores, max_iteration, max_evaluations, step_size,
             except AttributeError:
                 wr_line += (str(txt[0]) + '. ' + str(txt[1].decode()) + '\n')
 
-        wr_line += str("\nFile: " + f_path + '\n')
+        wr_line += str("\nFile: " + Dataset.get_source_name(f_path) + '\n')
         wr_line += str("\nPattern : Support" + '\n')
 
+        supp_error = '' if out.supp_error <= 0 else (' +/- ' + str(round(out.supp_error, 3)))
         for gp in list_gp:
-            wr_line += (str(gp.to_string()) + ' : ' + str(round(gp.support, 3)) + '\n')
+            wr_line += (str(gp.to_string()) + ' : ' + str(round(gp.support, 3)) + supp_error + '\n')
 
         if visuals[1]:
             wr_line += '\n\n' + "Evaluation: Cost" + '\n'
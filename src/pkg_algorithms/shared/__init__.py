@@ -4,4 +4,6 @@ __author__ = 'Dickson Owuor'
 __email__ = 'owuordickson@ieee.org'
 __version__ = '2.0'
 
-__all__ = ["dataset_bfs", "dataset_dfs", "fuzzy_mf", "gp", "profile"]
+__all__ = ["bin_store", "blocked_bin", "column_store", "dataset_bfs", "dataset_cache", "dataset_dfs", "dense_bin",
+           "fuzzy_mf", "gp", "lazy_bin", "mem_planner", "packed_bin", "profile", "rank_support", "sampled_bin",
+           "sliding_window", "sparse_bin"]
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""
+@author: "Dickson Owuor"
+@credits: "Anne Laurent"
+@license: "MIT"
+@version: "1.0"
+@email: "owuordickson@gmail.com"
+@created: "18 October 2026"
+
+On-disk store for bit-packed bins (bin_type='memmap'). Every bin is a np.memmap
+file in a scratch directory, so valid_bins only hold lightweight handles and
+bin rows are paged in from the page cache as they are read.
+
+Changes
+-------
+1. A bin file is deleted as soon as its memmap is garbage collected
+2. The scratch directory is deleted with the store (or at exit)
+
+"""
+
+import itertools
+import os
+import shutil
+import tempfile
+import weakref
+import numpy as np
+
+
+class BinStore:
+
+    def __init__(self, scratch_dir=None):
+        # scratch_dir=None uses the system temp directory (honours $TMPDIR)
+        self.scratch_dir = tempfile.mkdtemp(prefix='gp_bins_', dir=scratch_dir)
+        self.file_ids = itertools.count(1)  # thread-safe file numbering
+        self._finalizer = weakref.finalize(self, shutil.rmtree, self.scratch_dir, True)
+
+    def create(self, shape, dtype=np.uint8):
+        path = os.path.join(self.scratch_dir, 'bin_' + str(next(self.file_ids)) + '.dat')
+        bin_data = np.memmap(path, dtype=dtype, mode='w+', shape=shape)
+        weakref.finalize(bin_data, BinStore.remove_file, path)
+        return bin_data
+
+    def close(self):
+        self._finalizer()
+
+    @staticmethod
+    def remove_file(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
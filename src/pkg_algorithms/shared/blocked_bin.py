@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""
+@author: "Dickson Owuor"
+@credits: "Anne Laurent"
+@license: "MIT"
+@version: "1.0"
+@email: "owuordickson@gmail.com"
+@created: "18 October 2026"
+
+Blocked bins (bin_type='blocked'). A bin only keeps the attribute columns of its
+gradual items; supports are counted by comparing one tile of rows at a time,
+so peak memory is O(tile x n) instead of O(n^2).
+
+Changes
+-------
+1. Joining bins only concatenates their columns; nothing is computed
+2. count() compares, joins and counts one tile of rows at a time, the tile
+   size following from a memory budget (tile_bytes)
+3. Bins of distinct rows with multiplicities (weights), see packed_bin.py
+
+"""
+
+import numpy as np
+
+from .packed_bin import PackedBin, TILE_BYTES
+
+
+class BlockedBin:
+
+    def __init__(self, columns, n, equal=False, tile_rows=None, weights=None):
+        # A pair of tuples (i, j) lies in the bin iff x[j] < x[i] (or x[j] <= x[i]) for every column x
+        self.columns = list(columns)
+        self.size = n
+        self.equal = equal
+        self.tile_rows = tile_rows if tile_rows else BlockedBin.get_tile_rows(n)
+        self.weights = weights  # multiplicity of each row (or None)
+
+    def __and__(self, other):
+        return BlockedBin(self.columns + other.columns, self.size, self.equal, self.tile_rows, self.weights)
+
+    @property
+    def T(self):
+        # the transpose reverses the order of every column
+        return BlockedBin([-x for x in self.columns], self.size, self.equal, self.tile_rows, self.weights)
+
+    @property
+    def nbytes(self):
+        return 0
+
+    def count_and(self, other):
+        return (self & other).count()
+
+    def count(self):
+        bin_sum = 0
+        for start in range(0, self.size, self.tile_rows):
+            stop = min(self.size, start + self.tile_rows)
+            if self.weights is None:
+                bin_sum += int(np.count_nonzero(self.rows(start, stop)))
+            else:
+                bin_sum += PackedBin.count_weights(self.rows(start, stop), self.weights, start)
+        return bin_sum
+
+    def copy(self):
+        return BlockedBin(self.columns, self.size, self.equal, self.tile_rows, self.weights)
+
+    def rows(self, start, stop):
+        # rows [start, stop) of the bin
+        temp_bin = None
+        with np.errstate(invalid='ignore'):
+            for x in self.columns:
+                if self.equal:
+                    temp_pos = x <= x[start:stop, np.newaxis]
+                    if self.weights is None:
+                        temp_pos[np.arange(stop - start), np.arange(start, stop)] = False
+                else:
+                    temp_pos = x < x[start:stop, np.newaxis]
+                if temp_bin is None:
+                    temp_bin = temp_pos
+                else:
+                    temp_bin &= temp_pos
+        return temp_bin
+
+    def unpack(self):
+        return self.rows(0, self.size)
+
+    @staticmethod
+    def get_tile_rows(n, tile_bytes=TILE_BYTES):
+        # a tile holds the running AND plus one comparison: 2 x rows x n bytes
+        return max(1, int(tile_bytes) // (2 * max(n, 1)))
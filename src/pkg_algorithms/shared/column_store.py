@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""
+@author: "Dickson Owuor"
+@credits: "Anne Laurent"
+@license: "MIT"
+@version: "1.0"
+@email: "owuordickson@gmail.com"
+@created: "18 October 2026"
+
+Binary columnar data sets. A data set is a directory of per-column .npy files
+plus a JSON header (titles, time columns and row count). Columns are opened with
+mmap_mode='r', so opening costs milliseconds and processes that open the same
+data set share its pages read-only.
+
+Changes
+-------
+1. ColumnStore writes (header last) and opens a columnar directory
+2. ColumnTable stands in for the float matrix of a data set: columns are
+   memory-mapped and rows are only assembled when they are indexed
+
+"""
+
+import json
+import os
+import numpy as np
+
+
+# Name of the header file; a directory is a data set once its header exists
+HEADER_FILE = 'header.json'
+
+
+class ColumnStore:
+
+    @staticmethod
+    def write(store_dir, titles, data, time_cols):
+        os.makedirs(store_dir, exist_ok=True)
+        col_files = list()
+        for col in range(data.shape[1]):
+            col_file = 'col_' + str(col) + '.npy'
+            np.save(os.path.join(store_dir, col_file), np.ascontiguousarray(data[:, col], dtype=np.float64))
+            col_files.append(col_file)
+        header = {'row_count': int(data.shape[0]),
+                  'titles': [txt[1].decode() for txt in titles],
+                  'time_cols': [int(col) for col in time_cols],
+                  'columns': col_files}
+        temp_file = os.path.join(store_dir, HEADER_FILE + '.tmp')
+        with open(temp_file, 'w') as f:
+            json.dump(header, f)
+        os.replace(temp_file, os.path.join(store_dir, HEADER_FILE))
+
+    @staticmethod
+    def read(store_dir, use_cols=None):
+        # (titles, table, time columns) of a columnar data set; use_cols: indices of the only columns opened
+        with open(os.path.join(store_dir, HEADER_FILE), 'r') as f:
+            header = json.load(f)
+        col_ids = list(range(len(header['columns']))) if use_cols is None else list(use_cols)
+        columns = [np.load(os.path.join(store_dir, header['columns'][col]), mmap_mode='r') for col in col_ids]
+        titles = [header['titles'][col] for col in col_ids] if len(header['titles']) > 0 else []
+        time_cols = [col_ids.index(col) for col in header['time_cols'] if col in col_ids]
+        return titles, ColumnTable(columns), np.array(time_cols, dtype=int)
+
+    @staticmethod
+    def read_titles(store_dir):
+        with open(os.path.join(store_dir, HEADER_FILE), 'r') as f:
+            return json.load(f)['titles']
+
+    @staticmethod
+    def is_store(path):
+        return isinstance(path, str) and os.path.isfile(os.path.join(path, HEADER_FILE))
+
+
+class ColumnTable:
+
+    def __init__(self, columns):
+        self.columns = columns  # one (memory-mapped) 1-D array per column
+        self.dtype = columns[0].dtype
+        self.shape = (len(columns[0]), len(columns))
+        self.ndim = 2
+
+    @property
+    def T(self):
+        # attributes as rows: the columns themselves
+        return self.columns
+
+    @property
+    def nbytes(self):
+        return sum(col.nbytes for col in self.columns)
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __getitem__(self, key):
+        rows, cols = key if isinstance(key, tuple) else (key, slice(None))
+        if isinstance(cols, (int, np.integer)):
+            return self.columns[cols][rows]
+        col_ids = np.arange(len(self.columns))[cols]
+        if isinstance(rows, (int, np.integer)):
+            return np.array([self.columns[col][rows] for col in col_ids])
+        return np.column_stack([self.columns[col][rows] for col in col_ids])
+
+    def __array__(self, dtype=None, copy=None):
+        data = np.column_stack(self.columns)
+        return data if dtype is None else data.astype(dtype)
@@ -6,31 +6,159 @@
 @version: "4.0"
 @email: "owuordickson@gmail.com"
 @created: "12 July 2019"
-@modified: "17 Feb 2021"
+@modified: "18 October 2026"
 
 Changes
 -------
 1. Fetch all binaries during initialization
 2. Replaced loops for fetching binary rank with numpy function
+3. Stores valid bins as bit-packed matrices (see packed_bin.py)
+4. bin_type='rank' keeps only attribute ranks (see rank_support.py)
+5. Decrement items reuse the packed bin of the increment item (transpose flag)
+6. bin_type='memmap' writes packed bins to an on-disk store (see bin_store.py)
+7. Bins of different attributes are constructed in parallel (n_jobs threads)
+8. bin_type='blocked' keeps no binary matrix and counts supports one tile of
+   rows at a time (see blocked_bin.py); tile_bytes bounds the size of a tile
+9. CSV files are parsed into a float matrix (time columns as epoch seconds)
+   with the delimiter detected once; no string matrix is kept
+10. The date-time format of a column is inferred once from a sample (from all
+    its distinct values if day and month order is ambiguous) and the whole
+    column is converted in one vectorized pass; adjacent Date and Time columns
+    may be merged into one epoch column (merge_dt)
+11. Parsed columns, valid attributes and packed bins may be kept in an on-disk
+    cache (cache_dir) and memory-mapped by later runs (see dataset_cache.py)
+12. bin_type='sampled' estimates supports on a random sample of tuple pairs
+    within a Hoeffding error bound (see sampled_bin.py); verify_patterns()
+    replaces the estimates of final patterns with exact supports
+13. Single items are pre-screened from tie counts (O(n log n)) before any bin
+    is built; valid single items need no support count
+14. Identical rows may be kept once with their multiplicity (compress); bins
+    of distinct rows count tuple pairs with weights
+15. With a memory budget (mem_budget), the bin type is chosen by a planner
+    before any bin is built (see mem_planner.py)
+16. CSV files may be read in chunks of chunk_rows rows into an on-disk array,
+    so that loading needs memory for one chunk only
+17. Only selected columns (attributes, by index or header name) are parsed;
+    the data set holds the selected columns only, in file order
+18. file_path may also be an in-memory table (2-D ndarray or DataFrame); a
+    float table is wrapped without a copy
+19. file_path may also be a columnar directory (see column_store.py), whose
+    columns are memory-mapped read-only
+20. Rows may be appended (append): the supports of tracked patterns and of
+    single items are updated from the new tuple pairs only, in O(m n) for m
+    new rows
+21. Supports of gradual items are counted through one interface (get_bin,
+    count_pairs, validate_pattern) whatever the bin type; bin_type='dense'
+    keeps boolean matrices (see dense_bin.py) and cross_check() compares the
+    bin types on the same patterns
+22. The last join of a support count is fused with the count (count_and),
+    see kernels.py
+23. Packed and dense bins of items with few ordered pairs (density below
+    sparse_density) are kept as sorted pair lists (see sparse_bin.py)
+24. bin_type='lazy' builds the bin of an item on first use and keeps it in an
+    LRU cache of lru_bytes bytes (see lazy_bin.py); evicted bins are rebuilt
+25. A planned budget counts one tile per thread and, for level-wise mining
+    (apriori, GRAANK), the candidate bins of level 2; cand_bytes is the memory
+    left for candidate bins
+26. bin_type='auto' (default) is packed, or with a memory budget the bin type
+    of least estimated cost that fits; any other bin type must fit the budget
 
 """
 import csv
+from datetime import datetime
 from dateutil.parser import parse
+from dateutil.tz import tzlocal
 import time
 import numpy as np
+import pandas as pd
+import copy
 import gc
+import os
+import tempfile
+import weakref
+from multiprocessing.pool import ThreadPool
+from .packed_bin import PackedBin, TILE_BYTES
+from .dense_bin import DenseBin
+from .sparse_bin import SparseBin, SPARSE_DENSITY
+from .lazy_bin import BinLRU, LazyBin, LRU_BYTES
+from .blocked_bin import BlockedBin
+from .bin_store import BinStore
+from .rank_support import RankSupport, RankBin
+from .dataset_cache import DatasetCache
+from .sampled_bin import SampledBin
+from .mem_planner import MemPlanner, BIN_TYPES, WORK_BINS
+from .column_store import ColumnStore
+from .gp import GP
+
+
+# Date-time formats tried (in order) on a sample of each text column
+TIME_FORMATS = ['%Y-%m-%d %H:%M:%S', '%Y-%m-%dT%H:%M:%S', '%Y-%m-%d %H:%M', '%Y-%m-%d',
+                '%Y/%m/%d %H:%M:%S', '%Y/%m/%d %H:%M', '%Y/%m/%d',
+                '%m/%d/%Y %H:%M:%S', '%m/%d/%Y %H:%M', '%m/%d/%Y',
+                '%d/%m/%Y %H:%M:%S', '%d/%m/%Y %H:%M', '%d/%m/%Y',
+                '%d-%m-%Y %H:%M:%S', '%d-%m-%Y', '%d.%m.%Y %H:%M:%S', '%d.%m.%Y',
+                '%H:%M:%S', '%H:%M']
+
+# Formats without a date: parsed as seconds since midnight
+DAY_TIME_FORMATS = ['%H:%M:%S', '%H:%M']
 
 
 class Dataset:
 
-    def __init__(self, file_path, min_sup=0.5, eq=False):
+    def __init__(self, file_path, min_sup=0.5, eq=False, bin_type='auto', scratch_dir=None, n_jobs=1,
+                 tile_bytes=TILE_BYTES, merge_dt=False, cache_dir=None, sample_error=0.01, sample_delta=0.05,
+                 sample_seed=None, compress=False, mem_budget=None, chunk_rows=None, attributes=None,
+                 sparse_density=SPARSE_DENSITY, lru_bytes=LRU_BYTES, apriori=False):
         self.thd_supp = min_sup
         self.equal = eq
-        self.titles, self.data = Dataset.read_csv(file_path)
+        self.n_jobs = n_jobs
+        self.tile_bytes = tile_bytes  # memory budget of one tile of rows
+        self.bin_type = bin_type  # auto, packed, dense, memmap, lazy, rank, blocked, sampled
+        self.sample_error = sample_error  # requested error (bin_type='sampled')
+        self.sample_delta = sample_delta  # error bound holds with probability 1 - sample_delta
+        self.sample_seed = sample_seed
+        self.sparse_density = sparse_density  # bins of a lower density (pairs / n^2) are sparse (0: never)
+        self.lru_bytes = lru_bytes  # budget of the cached bins (bin_type='lazy')
+        self.bin_lru = None
+        self.apriori = apriori  # bins are joined level by level and every candidate of a level is kept (GRAANK)
+        self.cand_bytes = None  # memory left for candidate bins by a planned budget (None: no limit)
+        self.sample_pairs = None
+        self.supp_error = 0.0  # error bound of the supports (0: exact)
+        self.weights = None  # multiplicity of each row (compress)
+        self.bin_weights = None
+        self.mem_plan = None  # estimated (memory, disk) bytes of the planned bins
+        self.tracked = dict()  # pattern (tuples) -> [GP, number of tuple pairs] (see append)
+        self.item_pairs = dict()  # attribute -> number of tuple pairs of its increment item (see append)
+        self.item_supports = dict()  # support of each attribute after append
+        self.cache = None
+        if cache_dir and not (Dataset.is_frame(file_path) or ColumnStore.is_store(file_path)):
+            self.cache = DatasetCache(cache_dir, file_path, min_sup, eq, merge_dt, compress, attributes)
+        if Dataset.is_frame(file_path):
+            self.titles, self.data, self.time_cols = Dataset.read_frame(file_path, merge_dt=merge_dt,
+                                                                        attributes=attributes)
+        elif ColumnStore.is_store(file_path):
+            self.titles, self.data, self.time_cols = Dataset.read_columns(file_path, attributes=attributes)
+        elif (self.cache is not None) and self.cache.hit:
+            self.titles, self.data, self.time_cols = self.cache.load_data()
+        else:
+            self.titles, self.data, self.time_cols = Dataset.read_csv(file_path, merge_dt=merge_dt,
+                                                                      chunk_rows=chunk_rows, scratch_dir=scratch_dir,
+                                                                      attributes=attributes)
+            if self.cache is not None:
+                self.cache.save_data(self.titles, self.data, self.time_cols)
         self.row_count, self.col_count = self.data.shape
-        self.time_cols = self.get_time_cols()
         self.attr_cols = self.get_attr_cols()
+        if compress:
+            self.data, self.weights = Dataset.compress_rows(self.data, self.attr_cols)
+            self.row_count = int(np.sum(self.weights))
+        if mem_budget is not None:
+            self.bin_type = self.plan_bins(mem_budget, scratch_dir)
+        elif self.bin_type == 'auto':
+            self.bin_type = 'packed'
+        self.scratch_dir = scratch_dir
+        self.bin_store = BinStore(scratch_dir) if self.bin_type == 'memmap' else None
         self.valid_bins = np.array([])
+        self.bin_index = dict()  # (column, symbol) -> row of the item in valid_bins
         self.no_bins = False
         self.step_name = ''  # For T-GRAANK
         self.attr_size = 0  # For T-GRAANK
@@ -41,92 +169,633 @@ class Dataset:
         attr_cols = np.setdiff1d(all_cols, self.time_cols)
         return attr_cols
 
-    def get_time_cols(self):
-        # Retrieve first column only
-        time_cols = list()
-        n = self.col_count
-        for i in range(n):  # check every column/attribute for time format
-            row_data = str(self.data[0][i])
-            try:
-                time_ok, t_stamp = Dataset.test_time(row_data)
-                if time_ok:
-                    time_cols.append(i)
-            except ValueError:
-                continue
-        return np.array(time_cols)
+    def plan_bins(self, mem_budget, scratch_dir=None):
+        # bin type whose estimated footprint fits mem_budget: the cheapest one if bin_type is 'auto', bin_type
+        # itself otherwise (MemoryError if none fits)
+        planner = MemPlanner(mem_budget, self.tile_bytes, scratch_dir)
+        n = self.row_count
+        n_pairs = n * (n - 1) // 2
+        valid_cols = None if self.cache is None else self.cache.load_valid_cols()
+        if valid_cols is None:
+            # attributes that pass the tie-count pre-screen
+            valid_cols = [col for col in self.attr_cols if n_pairs > 0 and (
+                Dataset.count_item_pairs(self.data[:, col], self.equal, self.weights) / n_pairs >= self.thd_supp)]
+        m = min(n_pairs, SampledBin.get_sample_size(self.sample_error, self.sample_delta, self.equal))
+        u = self.data.shape[0]
+        k = len(valid_cols)
+        work_bins = MemPlanner.get_apriori_bins(k) if self.apriori else WORK_BINS
+        estimates = planner.estimate(n, u, self.col_count, k, m, self.n_jobs, work_bins)
+        lru_bytes = planner.get_lru_bytes(u, self.col_count, self.n_jobs, work_bins)
+        bin_type = planner.choose(estimates, planner.estimate_costs(n, u, k, lru_bytes), self.bin_type)
+        self.mem_plan = estimates[bin_type]
+        if bin_type == 'lazy':
+            self.lru_bytes = lru_bytes
+        if self.apriori and bin_type != 'memmap':
+            # candidate bins may take what the other bins leave of the budget (the LRU cache takes the rest if lazy)
+            fixed_bytes = planner.estimate(n, u, self.col_count, k, m, self.n_jobs, 0)[bin_type][0]
+            self.cand_bytes = (self.mem_plan[0] if bin_type == 'lazy' else planner.mem_budget) - fixed_bytes
+        print("Bin type: " + bin_type + " (about " + MemPlanner.format_size(self.mem_plan[0]) + " of memory)")
+        return bin_type
 
     def init_gp_attributes(self, attr_data=None):
-        # (check) implement parallel multiprocessing
         # 1. Transpose csv array data
+        cache = None
+        weights = None
         if attr_data is None:
             attr_data = self.data.T
             self.attr_size = self.row_count
+            cache = self.cache
+            weights = self.weights
         else:
-            self.attr_size = len(attr_data[self.attr_cols[0]])
+            self.attr_size = len(attr_data[0]) if len(attr_data) > 0 else 0
+        self.bin_weights = weights
+        if len(self.attr_cols) == 0:
+            # every column is a time column: no bins (nor threads or rank supports to build them)
+            self.valid_bins = np.array([])
+            self.bin_index = dict()
+            self.no_bins = True
+            return
 
         # 2. Construct and store 1-item_set valid bins
         # execute binary rank to calculate support of pattern
-        n = self.attr_size
+        r_sup = None
+        if self.bin_type == 'rank':
+            r_sup = RankSupport(Dataset.expand_rows(attr_data, weights), self.attr_cols, self.equal)
+        elif self.bin_type == 'sampled':
+            n = self.attr_size
+            m = SampledBin.get_sample_size(self.sample_error, self.sample_delta, self.equal)
+            self.sample_pairs = SampledBin.sample_pairs(n, m, self.sample_seed)
+            self.supp_error = SampledBin.get_error(n, self.sample_pairs[0].size, self.sample_delta, self.equal)
+            if weights is not None:
+                # pairs of tuples are drawn first, then mapped to their distinct rows
+                row_ids = np.repeat(np.arange(weights.size), weights)
+                self.sample_pairs = (row_ids[self.sample_pairs[0]], row_ids[self.sample_pairs[1]])
+        valid_cols = None if cache is None else cache.load_valid_cols()
+        if self.bin_type == 'lazy':
+            # bins are built from attr_data when they are used (packed bins may be loaded from the cache)
+            bin_cache = cache if valid_cols is not None else None
+            self.bin_lru = BinLRU(lambda col: self.build_bin(col, np.array(attr_data[col], dtype=float),
+                                                             cache=bin_cache), self.lru_bytes)
+        if valid_cols is not None:
+            # 2a. Valid attributes (and their packed bins) are known from the cache
+            lst_bins = [self.fetch_bins(col, attr_data, r_sup, valid=True) for col in valid_cols]
+        elif self.n_jobs > 1:
+            # threads share the bins in memory (or in the bin store): nothing is pickled
+            with ThreadPool(min(self.n_jobs, len(self.attr_cols))) as pool:
+                lst_bins = pool.map(lambda col: self.fetch_bins(col, attr_data, r_sup), self.attr_cols)
+        else:
+            lst_bins = [self.fetch_bins(col, attr_data, r_sup) for col in self.attr_cols]
+        if cache is not None:
+            if valid_cols is None:
+                lst_bins = [bins for bins in lst_bins if len(bins) > 0]
+                valid_cols = [bins[0][0][0] for bins in lst_bins]
+                cache.save_valid_cols(valid_cols)
+            for col, bins in zip(valid_cols, lst_bins):
+                if isinstance(bins[0][1], PackedBin) and not cache.has_bin(col):
+                    cache.save_bin(col, bins[0][1].bin_data)
         valid_bins = list()
-        for col in self.attr_cols:
-            col_data = np.array(attr_data[col], dtype=float)
-            incr = np.array((col, '+'), dtype='i, S1')
-            decr = np.array((col, '-'), dtype='i, S1')
-            # temp_pos = Dataset.bin_rank(col_data, equal=self.equal)
-
-            # 2a. Generate 1-itemset gradual items
-            with np.errstate(invalid='ignore'):
-                if not self.equal:
-                    temp_pos = col_data < col_data[:, np.newaxis]
-                else:
-                    temp_pos = col_data <= col_data[:, np.newaxis]
-                    np.fill_diagonal(temp_pos, 0)
-
-                # 2b. Check support of each generated itemset
-                supp = float(np.sum(temp_pos)) / float(n * (n - 1.0) / 2.0)
-                if supp >= self.thd_supp:
-                    valid_bins.append(np.array([incr.tolist(), temp_pos], dtype=object))
-                    valid_bins.append(np.array([decr.tolist(), temp_pos.T], dtype=object))
+        for bins in lst_bins:
+            valid_bins.extend(bins)
         self.valid_bins = np.array(valid_bins)
+        self.bin_index = {tuple(v_bin[0]): i for i, v_bin in enumerate(valid_bins)}
         # print(self.valid_bins)
         if len(self.valid_bins) < 3:
             self.no_bins = True
         gc.collect()
 
+    def fetch_bins(self, col, attr_data, r_sup=None, valid=False):
+        # valid: the support of col is known to reach thd_supp (from the cache)
+        n = self.attr_size
+        incr = np.array((col, '+'), dtype='i, S1')
+        decr = np.array((col, '-'), dtype='i, S1')
+        col_data = np.array(attr_data[col], dtype=float)
+
+        # 2a. Pre-screen: (exact) support of a single item from the tie counts of the
+        # column, so that attributes below thd_supp never allocate a pair matrix
+        item_pairs = None
+        if not valid:
+            item_pairs = Dataset.count_item_pairs(col_data, self.equal, self.bin_weights)
+            supp = float(item_pairs) / float(n * (n - 1.0) / 2.0)
+            if supp < self.thd_supp:
+                return []
+
+        # 2b. Generate 1-itemset gradual items
+        if r_sup is not None:
+            incr_bin = RankBin(r_sup, [incr.tolist()])
+            decr_bin = RankBin(r_sup, [decr.tolist()])
+            return [np.array([incr.tolist(), incr_bin], dtype=object),
+                    np.array([decr.tolist(), decr_bin], dtype=object)]
+        elif self.bin_type == 'sampled':
+            incr_bin = SampledBin.bin_rank(col_data, self.sample_pairs, equal=self.equal, n=n)
+        elif self.bin_type == 'blocked':
+            # bins have one row per distinct row (col_data.size <= n)
+            tile_rows = BlockedBin.get_tile_rows(col_data.size, self.tile_bytes)
+            incr_bin = BlockedBin([col_data], col_data.size, equal=self.equal, tile_rows=tile_rows,
+                                  weights=self.bin_weights)
+        elif self.bin_type == 'lazy':
+            incr_bin = LazyBin(self.bin_lru, col)
+        else:
+            incr_bin = self.build_bin(col, col_data, item_pairs, cache=(self.cache if valid else None))
+        return [np.array([incr.tolist(), incr_bin], dtype=object),
+                np.array([decr.tolist(), incr_bin.T], dtype=object)]
+
+    def build_bin(self, col, col_data, item_pairs=None, cache=None):
+        # packed (or dense) increment bin of attribute col, sparse if it has few tuple pairs;
+        # cache: packed bins are loaded from it if it holds them
+        n = self.attr_size
+        if (cache is not None) and (self.bin_type != 'dense') and cache.has_bin(col):
+            # memory-mapped (read-only) from the cache
+            return PackedBin(cache.load_bin(col), col_data.size, store=self.bin_store,
+                             tile_rows=PackedBin.get_block_size(col_data.size, self.tile_bytes),
+                             weights=self.bin_weights)
+        if item_pairs is None:
+            item_pairs = Dataset.count_item_pairs(col_data, self.equal, self.bin_weights)
+        # density of the increment bin: its tuple pairs against n^2
+        if item_pairs < self.sparse_density * float(n) * float(n):
+            return SparseBin.bin_rank(col_data, equal=self.equal, weights=self.bin_weights)
+        if self.bin_type == 'dense':
+            return DenseBin.bin_rank(col_data, equal=self.equal, weights=self.bin_weights)
+        tile_rows = PackedBin.get_block_size(col_data.size, self.tile_bytes)
+        return PackedBin.bin_rank(col_data, equal=self.equal, store=self.bin_store, tile_rows=tile_rows,
+                                  weights=self.bin_weights)
+
     @staticmethod
-    def read_csv(file):
-        # 1. Retrieve data set from file
+    def count_item_pairs(col_data, equal=False, weights=None):
+        # tuple pairs in the bin of a single item: pairs of non-null values less the
+        # tied pairs (or plus the tied pairs, which are ordered both ways, if equal)
+        if weights is not None:
+            col_data = np.repeat(col_data, weights)
+        col_data = col_data[~np.isnan(col_data)]
+        m = col_data.size
+        ties = RankSupport.count_ties(col_data)
+        if equal:
+            return int(m * (m - 1) // 2 + ties)
+        return int(m * (m - 1) // 2 - ties)
+
+    def get_bin(self, gi):
+        # bin of a valid gradual item (or None)
+        i = self.bin_index.get(tuple(gi.gradual_item.tolist()))
+        return None if i is None else LazyBin.resolve(self.valid_bins[i][1])
+
+    def count_pairs(self, gradual_items):
+        # tuple pairs in the joint bin of the valid items among gradual_items (0 if none is valid)
+        lst_bins = [valid_bin for valid_bin in (self.get_bin(gi) for gi in gradual_items) if valid_bin is not None]
+        if len(lst_bins) == 0:
+            return 0
+        temp_bin = lst_bins[0]
+        for valid_bin in lst_bins[1:-1]:
+            temp_bin = temp_bin & valid_bin
+        return temp_bin.count() if len(lst_bins) == 1 else temp_bin.count_and(lst_bins[-1])
+
+    def validate_pattern(self, pattern):
+        # largest sub-pattern that reaches thd_supp, adding the (valid) items of pattern in order;
+        # pattern itself if no two items do
+        n = self.attr_size
+        gen_pattern = GP()
+        bin_arr = None
+        for gi in pattern.gradual_items:
+            valid_bin = self.get_bin(gi)
+            if valid_bin is None:
+                continue
+            if bin_arr is None:
+                bin_arr = valid_bin
+                gen_pattern.add_gradual_item(gi)
+            else:
+                temp_bin = bin_arr & valid_bin
+                supp = float(temp_bin.count()) / float(n * (n - 1.0) / 2.0)
+                if supp >= self.thd_supp:
+                    bin_arr = temp_bin
+                    gen_pattern.add_gradual_item(gi)
+                    gen_pattern.set_support(supp)
+        if len(gen_pattern.gradual_items) <= 1:
+            return pattern
+        return gen_pattern
+
+    def cross_check(self, lst_gp, bin_types=None):
+        # supports of lst_gp from every bin type (bins are rebuilt from the same data). Returns the supports
+        # {bin type: [support of each pattern]} and the disagreements with the exact ranks
+        # [(pattern, bin type, support, exact support)]; sampled supports may be off by their error bound
+        n_pairs = float(self.attr_size * (self.attr_size - 1.0) / 2.0) if self.attr_size > 1 else 1.0
+        supports = dict()
+        errors = dict()
+        for bin_type in (BIN_TYPES if bin_types is None else bin_types):
+            d_set = copy.copy(self)
+            d_set.bin_type = bin_type
+            d_set.cache = None
+            d_set.bin_store = BinStore(self.scratch_dir) if bin_type == 'memmap' else None
+            d_set.supp_error = 0.0
+            d_set.init_gp_attributes()
+            supports[bin_type] = [d_set.count_pairs(gp.gradual_items) / n_pairs for gp in lst_gp]
+            errors[bin_type] = d_set.supp_error
+        r_sup = RankSupport(Dataset.expand_rows(self.data.T, self.weights), self.attr_cols, self.equal)
+        exact = [r_sup.count_pattern([[gi.attribute_col, gi.symbol] for gi in gp.gradual_items]) / n_pairs
+                 for gp in lst_gp]
+        mismatches = list()
+        for bin_type, lst_supp in supports.items():
+            for gp, supp, exact_supp in zip(lst_gp, lst_supp, exact):
+                if abs(supp - exact_supp) > errors[bin_type] + 1e-9:
+                    mismatches.append((gp, bin_type, supp, exact_supp))
+        return supports, mismatches
+
+    def verify_patterns(self, lst_gp):
+        # exact supports of (estimated) patterns from the attribute ranks: no binary matrix is built
+        if self.supp_error <= 0:
+            return lst_gp
+        n = self.row_count
+        r_sup = RankSupport(Dataset.expand_rows(self.data.T, self.weights), self.attr_cols, self.equal)
+        valid_gps = list()
+        for gp in lst_gp:
+            gi_list = [[gi.attribute_col, gi.symbol] for gi in gp.gradual_items]
+            supp = float(r_sup.count_pattern(gi_list)) / float(n * (n - 1.0) / 2.0)
+            if supp >= self.thd_supp:
+                gp.set_support(supp)
+                valid_gps.append(gp)
+        self.supp_error = 0.0
+        return valid_gps
+
+    def track_patterns(self, lst_gp):
+        # exact tuple-pair counts of (mined) patterns, kept up to date by append()
+        r_sup = RankSupport(Dataset.expand_rows(self.data.T, self.weights), self.attr_cols, self.equal)
+        for gp in lst_gp:
+            key = tuple(gp.get_tuples())
+            if key not in self.tracked:
+                self.tracked[key] = [gp, r_sup.count_pattern([list(gi) for gi in key])]
+
+    def append(self, rows):
+        # adds m rows and updates the tracked patterns from the m (n + m) new tuple pairs only. Returns the
+        # tracked patterns that still reach thd_supp. Bins describe the old rows: init_gp_attributes() rebuilds them
+        if self.weights is not None:
+            raise Exception("rows cannot be appended to a compressed data set")
+        rows = np.asarray(rows, dtype=float).reshape(-1, self.col_count)
+        start = self.row_count
+        self.data = np.concatenate((np.asarray(self.data), rows))
+        self.row_count = self.attr_size = self.data.shape[0]
+        self.cache = None
+        self.valid_bins = np.array([])
+        self.bin_index = dict()
+        self.bin_lru = None
+        self.no_bins = True
+
+        n = self.row_count
+        n_pairs = float(n * (n - 1.0) / 2.0)
+        for col in self.attr_cols:
+            if col not in self.item_pairs:
+                # O(n log n) from the tie counts of the old rows, on the first append only
+                self.item_pairs[col] = Dataset.count_item_pairs(self.data[:start, col], self.equal)
+            self.item_pairs[col] += Dataset.count_new_pairs(self.data, [(col, '+')], start, self.equal)
+            self.item_supports[col] = self.item_pairs[col] / n_pairs
+        valid_gps = list()
+        for key, obj in self.tracked.items():
+            obj[1] += Dataset.count_new_pairs(self.data, key, start, self.equal)
+            supp = obj[1] / n_pairs
+            obj[0].set_support(supp)
+            if supp >= self.thd_supp:
+                valid_gps.append(obj[0])
+        return valid_gps
+
+    @staticmethod
+    def count_new_pairs(data, gi_list, start, equal=False):
+        # tuple pairs of pattern gi_list between every row r >= start and the rows before it
+        coords = Dataset.pattern_coords(data, gi_list)
+        return sum(Dataset.count_row_pairs(coords[:r], coords[r], equal) for r in range(start, coords.shape[0]))
+
+    @staticmethod
+    def pattern_coords(data, gi_list):
+        # one column per gradual item, negated for '-': a pair follows the pattern if it increases in every column
+        return np.column_stack([data[:, col] if (sym == '+' or sym == b'+') else -data[:, col]
+                                for col, sym in gi_list])
+
+    @staticmethod
+    def count_row_pairs(coords, row, equal=False):
+        # tuple pairs (in both directions) between one row and the rows of coords, in O(len(coords));
+        # null values take part in no pair
+        with np.errstate(invalid='ignore'):
+            if equal:
+                count = np.count_nonzero(np.all(coords <= row, axis=1))
+                count += np.count_nonzero(np.all(row <= coords, axis=1))
+            else:
+                count = np.count_nonzero(np.all(coords < row, axis=1))
+                count += np.count_nonzero(np.all(row < coords, axis=1))
+        return int(count)
+
+    @staticmethod
+    def compress_rows(data, attr_cols):
+        # rows that are identical in every attribute are kept once (first occurrence), with their multiplicity
+        attr_data = np.ascontiguousarray(data[:, attr_cols])
+        keys = attr_data.view(np.dtype((np.void, attr_data.dtype.itemsize * attr_data.shape[1]))).ravel()
+        first_rows, counts = np.unique(keys, return_index=True, return_counts=True)[1:]
+        order = np.argsort(first_rows)
+        return np.array(data[first_rows[order]]), counts[order].astype(np.int64)
+
+    @staticmethod
+    def expand_rows(attr_data, weights=None):
+        # columns of distinct rows, each row repeated by its multiplicity
+        if weights is None:
+            return attr_data
+        return np.repeat(np.asarray(attr_data), weights, axis=1)
+
+    @staticmethod
+    def read_csv(file, dtype=np.float64, merge_dt=False, chunk_rows=None, scratch_dir=None, attributes=None):
+        # chunk_rows: the file is read chunk_rows rows at a time into an on-disk array (see read_csv_chunks)
+        # attributes: indices or header names of the only columns that are parsed (None: all)
         try:
-            with open(file, 'r') as f:
-                dialect = csv.Sniffer().sniff(f.readline(), delimiters=";,' '\t")
-                f.seek(0)
-                reader = csv.reader(f, dialect)
-                raw_data = list(reader)
-                f.close()
-
-            if len(raw_data) <= 1:
+            dialect, titles = Dataset.read_header(file)
+            use_cols = None
+            if attributes is not None:
+                use_cols = Dataset.select_cols(titles, attributes)
+                titles = Dataset.select_titles(titles, use_cols)
+            if chunk_rows is not None:
+                data, time_cols = Dataset.read_csv_chunks(file, dialect, titles, chunk_rows, dtype, merge_dt,
+                                                          scratch_dir, use_cols)
+                return titles, data, time_cols
+
+            # 2. Parse the columns with the C reader: numeric columns come out as floats
+            raw_data = pd.read_csv(file, sep=dialect.delimiter, quotechar=dialect.quotechar, header=None,
+                                   skiprows=(1 if titles.size > 0 else 0), skipinitialspace=True, usecols=use_cols)
+            if raw_data.shape[0] <= 1:
                 print("Unable to read CSV file")
                 raise Exception("CSV file read error. File has little or no data")
-            else:
-                print("Data fetched from CSV file")
-                # 2. Get table headers
-                if raw_data[0][0].replace('.', '', 1).isdigit() or raw_data[0][0].isdigit():
-                    titles = np.array([])
-                else:
-                    if raw_data[0][1].replace('.', '', 1).isdigit() or raw_data[0][1].isdigit():
-                        titles = np.array([])
-                    else:
-                        # titles = self.convert_data_to_array(data, has_title=True)
-                        keys = np.arange(len(raw_data[0]))
-                        values = np.array(raw_data[0], dtype='S')
-                        titles = np.rec.fromarrays((keys, values), names=('key', 'value'))
-                        raw_data = np.delete(raw_data, 0, 0)
-                return titles, np.asarray(raw_data)
-                # return Dataset.get_tbl_headers(temp)
+            print("Data fetched from CSV file")
+
+            # 3. Convert each column once: time columns to epoch seconds, others to numbers
+            data, t_formats = Dataset.convert_cols(raw_data, dtype)
+            del raw_data
+            gc.collect()
+
+            # 4. Merge a Date column with the Time column that follows it
+            if merge_dt:
+                Dataset.merge_time_cols(data, t_formats)
+            return titles, data, np.array(sorted(t_formats.keys()), dtype=int)
         except Exception as error:
             print("Unable to read CSV file")
             raise Exception("CSV file read error. " + str(error))
 
+    @staticmethod
+    def read_frame(frame, dtype=np.float64, merge_dt=False, attributes=None):
+        # titles, data and time columns of an in-memory table. A 2-D ndarray of dtype values, or a DataFrame
+        # held in one block of them, is used as it is (zero-copy view); other tables are converted column by column
+        try:
+            if isinstance(frame, pd.DataFrame):
+                titles = Dataset.make_titles([str(col) for col in frame.columns])
+            else:
+                frame = np.asarray(frame)
+                if frame.ndim != 2:
+                    raise Exception("a 2-D array is required")
+                titles = np.array([])
+            if attributes is not None:
+                use_cols = Dataset.select_cols(titles, attributes)
+                titles = Dataset.select_titles(titles, use_cols)
+                frame = frame.iloc[:, use_cols] if isinstance(frame, pd.DataFrame) else frame[:, use_cols]
+            if frame.shape[0] <= 1:
+                raise Exception("Table has little or no data")
+
+            if isinstance(frame, np.ndarray) and (frame.dtype.kind in 'biuf'):
+                return titles, frame.astype(dtype, copy=False), np.array([], dtype=int)
+            frame = pd.DataFrame(frame)
+            if all(frame.dtypes == dtype):
+                return titles, frame.to_numpy(dtype=dtype, copy=False), np.array([], dtype=int)
+            # shallow copy: converted columns are released from the copy, never from the caller's table
+            data, t_formats = Dataset.convert_cols(frame.copy(deep=False), dtype)
+            if merge_dt:
+                Dataset.merge_time_cols(data, t_formats)
+            return titles, data, np.array(sorted(t_formats.keys()), dtype=int)
+        except Exception as error:
+            raise Exception("Table read error. " + str(error))
+
+    @staticmethod
+    def read_columns(store_dir, attributes=None):
+        # titles, (memory-mapped) columns and time columns of a columnar data set
+        names = ColumnStore.read_titles(store_dir)
+        titles = Dataset.make_titles(names) if len(names) > 0 else np.array([])
+        use_cols = None if attributes is None else Dataset.select_cols(titles, attributes)
+        names, data, time_cols = ColumnStore.read(store_dir, use_cols)
+        titles = Dataset.make_titles(names) if len(names) > 0 else np.array([])
+        print("Data fetched from columnar store")
+        return titles, data, time_cols
+
+    @staticmethod
+    def write_columns(file, store_dir, merge_dt=False, chunk_rows=None):
+        # converts a CSV file into a columnar data set (opened by passing store_dir as file_path)
+        titles, data, time_cols = Dataset.read_csv(file, merge_dt=merge_dt, chunk_rows=chunk_rows)
+        ColumnStore.write(store_dir, titles, data, time_cols)
+        return store_dir
+
+    @staticmethod
+    def is_frame(file_path):
+        return isinstance(file_path, (np.ndarray, pd.DataFrame))
+
+    @staticmethod
+    def get_source_name(file_path):
+        # file name, or the shape of an in-memory table (for reports)
+        if Dataset.is_frame(file_path):
+            return '<' + type(file_path).__name__ + ' ' + 'x'.join(str(i) for i in file_path.shape) + '>'
+        return str(file_path)
+
+    @staticmethod
+    def read_header(file):
+        # 1. Detect the delimiter and the table headers from the first line only
+        with open(file, 'r') as f:
+            first_line = f.readline()
+            dialect = csv.Sniffer().sniff(first_line, delimiters=";,' '\t")
+            first_row = next(csv.reader([first_line], dialect))
+            f.close()
+
+        if first_row[0].replace('.', '', 1).isdigit() or first_row[0].isdigit():
+            titles = np.array([])
+        elif len(first_row) > 1 and (first_row[1].replace('.', '', 1).isdigit() or first_row[1].isdigit()):
+            titles = np.array([])
+        else:
+            titles = Dataset.make_titles(first_row)
+        return dialect, titles
+
+    @staticmethod
+    def make_titles(names):
+        keys = np.arange(len(names))
+        values = np.array(names, dtype='S')
+        return np.rec.fromarrays((keys, values), names=('key', 'value'))
+
+    @staticmethod
+    def read_csv_chunks(file, dialect, titles, chunk_rows, dtype=np.float64, merge_dt=False, scratch_dir=None,
+                        use_cols=None):
+        # rows are parsed chunk_rows at a time and appended to a scratch file, which is memory-mapped once
+        # complete: peak memory is one chunk. The column types (and time formats) of the first chunk hold for all
+        reader = pd.read_csv(file, sep=dialect.delimiter, quotechar=dialect.quotechar, header=None,
+                             skiprows=(1 if titles.size > 0 else 0), skipinitialspace=True, usecols=use_cols,
+                             chunksize=int(chunk_rows))
+        fd, path = tempfile.mkstemp(prefix='gp_data_', suffix='.dat', dir=scratch_dir)
+        row_count = 0
+        col_count = 0
+        t_formats = None
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                for raw_data in reader:
+                    data, t_formats = Dataset.convert_cols(raw_data, dtype, t_formats)
+                    if merge_dt:
+                        Dataset.merge_time_cols(data, t_formats)
+                    f.write(data.tobytes())
+                    row_count += data.shape[0]
+                    col_count = data.shape[1]
+                    del raw_data, data
+            if row_count <= 1:
+                raise Exception("File has little or no data")
+        except Exception:
+            BinStore.remove_file(path)
+            raise
+        print("Data fetched from CSV file")
+        data = np.memmap(path, dtype=dtype, mode='r+', shape=(row_count, col_count))
+        weakref.finalize(data, BinStore.remove_file, path)
+        return data, np.array(sorted(t_formats.keys()), dtype=int)
+
+    @staticmethod
+    def select_cols(titles, attributes):
+        # sorted indices of the selected columns: header names, or column indices
+        names = [txt[1].decode() for txt in titles]
+        use_cols = set()
+        for attr in attributes:
+            attr = attr.decode() if isinstance(attr, bytes) else attr
+            if isinstance(attr, str) and attr.strip() in names:
+                use_cols.add(names.index(attr.strip()))
+            elif str(attr).strip().isdigit():
+                use_cols.add(int(attr))
+            else:
+                raise Exception("unknown attribute: " + str(attr))
+        if (len(names) > 0) and (max(use_cols, default=0) >= len(names)):
+            raise Exception("attribute index out of range: " + str(max(use_cols)))
+        if len(use_cols) <= 0:
+            raise Exception("no attribute selected")
+        return sorted(use_cols)
+
+    @staticmethod
+    def select_titles(titles, use_cols):
+        # titles of the selected columns, numbered as columns of the data set
+        if titles.size <= 0:
+            return titles
+        return Dataset.make_titles([titles[i][1] for i in use_cols])
+
+    @staticmethod
+    def convert_cols(raw_data, dtype=np.float64, t_formats=None):
+        # float matrix of a table of parsed columns. t_formats maps time columns to their formats;
+        # if it is None, time columns are detected (and their formats inferred) from raw_data
+        data = np.empty(raw_data.shape, dtype=dtype)
+        detect = t_formats is None
+        t_formats = dict() if detect else t_formats
+        for i in range(raw_data.shape[1]):
+            col_data = raw_data[raw_data.columns[i]]
+            if i in t_formats:
+                data[:, i] = Dataset.parse_time_col(col_data, t_formats[i])
+            elif col_data.dtype.kind == 'M':
+                # date-time values (in-memory tables)
+                t_formats[i] = None
+                data[:, i] = Dataset.epoch_seconds(col_data)
+            elif col_data.dtype.kind in 'biuf':
+                data[:, i] = col_data.to_numpy(dtype=dtype)
+            else:
+                time_ok = False
+                t_format = None
+                if detect:
+                    t_format = Dataset.infer_time_format(col_data)
+                    if t_format is None:
+                        # no fixed format: fall back to parsing the first value
+                        try:
+                            time_ok, t_stamp = Dataset.test_time(str(col_data.iloc[0]))
+                        except ValueError:
+                            time_ok = False
+                    else:
+                        time_ok = True
+                if time_ok:
+                    t_formats[i] = t_format
+                    data[:, i] = Dataset.parse_time_col(col_data, t_format)
+                else:
+                    # invalid entries become NaN, which lie in no bin
+                    data[:, i] = pd.to_numeric(col_data, errors='coerce').to_numpy(dtype=dtype)
+            raw_data[raw_data.columns[i]] = None  # free the strings of this column
+        return data, t_formats
+
+    @staticmethod
+    def merge_time_cols(data, t_formats):
+        for i in t_formats.keys():
+            t_format = t_formats.get(i + 1)
+            if (t_formats.get(i) not in [None] + DAY_TIME_FORMATS) and (t_format in DAY_TIME_FORMATS):
+                # the Date column becomes date + time; the Time column is kept (seconds of the day)
+                data[:, i] += data[:, (i + 1)]
+
+    @staticmethod
+    def infer_time_format(col_data, sample_size=100):
+        # format of TIME_FORMATS that parses the most values of a sample of the distinct values, or None if no
+        # format parses half of them. Values that parse with no format (such as '?') are missing values and do
+        # not count against a format. Formats that tie on the sample (day and month order) are compared on all
+        # the distinct values; if they still tie, the first one is taken and reported
+        values = pd.unique(pd.Series(col_data).dropna().astype(str).str.strip())
+        sample = values[:sample_size]
+        counts = Dataset.count_time_formats(sample, TIME_FORMATS)
+        best_count = max(counts)
+        if (best_count <= 0) or (2 * best_count < len(sample)):
+            return None
+        best_formats = [t_format for t_format, count in zip(TIME_FORMATS, counts) if count == best_count]
+        if (len(best_formats) > 1) and (len(values) > len(sample)):
+            counts = Dataset.count_time_formats(values, best_formats)
+            best_formats = [t_format for t_format, count in zip(best_formats, counts) if count == max(counts)]
+        if len(best_formats) > 1:
+            print("Ambiguous date-time format (" + ' or '.join(best_formats) + "): read as " + best_formats[0])
+        return best_formats[0]
+
+    @staticmethod
+    def count_time_formats(values, t_formats):
+        # number of values that parse with each format of t_formats
+        counts = list()
+        for t_format in t_formats:
+            count = 0
+            for val in values:
+                try:
+                    datetime.strptime(val, t_format)
+                    count += 1
+                except ValueError:
+                    continue
+            counts.append(count)
+        return counts
+
+    @staticmethod
+    def parse_time_col(col_data, t_format=None):
+        # each distinct date-time string is parsed once, entries that do not parse become NaN
+        codes, values = pd.factorize(pd.Series(col_data).astype(str).str.strip())
+        if t_format is None:
+            t_stamps = np.array([Dataset.parse_time(val) for val in values], dtype=float)
+        else:
+            # one vectorized pass with a fixed format
+            date_times = pd.Series(pd.to_datetime(values, format=t_format, errors='coerce'))
+            if t_format in DAY_TIME_FORMATS:
+                t_stamps = (date_times - date_times.dt.normalize()).dt.total_seconds().to_numpy(dtype=float)
+            else:
+                t_stamps = Dataset.epoch_seconds(date_times)
+        return np.where(codes >= 0, t_stamps[codes], np.nan)
+
+    @staticmethod
+    def parse_time(date_str):
+        # epoch seconds of a date-time string of any format (NaN if it does not parse)
+        try:
+            return time.mktime(parse(date_str).timetuple())
+        except (ValueError, OverflowError):
+            return np.nan
+
+    @staticmethod
+    def epoch_seconds(date_times):
+        # naive date-times are local time, as time.mktime()
+        date_times = pd.Series(date_times).reset_index(drop=True)
+        if date_times.dt.tz is not None:
+            return (date_times - pd.Timestamp(0, tz='UTC')).dt.total_seconds().to_numpy(dtype=float)
+        t_zone = tzlocal()
+        local_times = date_times.dt.tz_localize(t_zone, ambiguous='NaT', nonexistent='NaT')
+        t_stamps = np.array((local_times - pd.Timestamp(0, tz='UTC')).dt.total_seconds(), dtype=float)
+        # times within a day of a daylight saving change (which may repeat or skip them) are read by
+        # time.mktime(), as the other formats
+        day = pd.Timedelta(days=1)
+        offsets = [(date_times + d) - (date_times + d).dt.tz_localize(t_zone, ambiguous='NaT', nonexistent='NaT')
+                   .dt.tz_convert(None) for d in (-day, day)]
+        changes = (offsets[0] != offsets[1]).to_numpy() | np.isnan(t_stamps)
+        for i in np.flatnonzero(changes & date_times.notna().to_numpy()):
+            t_stamps[i] = time.mktime(date_times[i].timetuple())
+        return t_stamps
+
     @staticmethod
     def test_time(date_str):
         # add all the possible formats
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""
+@author: "Dickson Owuor"
+@credits: "Anne Laurent"
+@license: "MIT"
+@version: "1.0"
+@email: "owuordickson@gmail.com"
+@created: "18 October 2026"
+
+On-disk cache of preprocessed data sets. An entry is a directory of .npy files
+plus a JSON manifest, keyed by the content hash of the CSV file, min_sup and eq.
+Cached arrays are loaded with mmap_mode='r'.
+
+Changes
+-------
+1. Caches the parsed columns, the time columns and the table headers
+2. Caches the valid attributes and their packed (increment) bins
+3. The selected columns (if any) are part of the key
+
+"""
+
+import hashlib
+import json
+import os
+import numpy as np
+
+
+class DatasetCache:
+
+    def __init__(self, cache_dir, file_path, min_sup, eq=False, merge_dt=False, compress=False, attributes=None):
+        self.file_hash = DatasetCache.hash_file(file_path)
+        key = '{}|{}|{}|{}|{}'.format(self.file_hash, repr(float(min_sup)), int(eq), int(merge_dt), int(compress))
+        if attributes is not None:
+            key += '|' + ','.join(str(attr) for attr in attributes)
+        self.entry_dir = os.path.join(cache_dir, hashlib.sha1(key.encode()).hexdigest()[:20])
+        self.manifest = DatasetCache.read_manifest(self.entry_dir)
+
+    @property
+    def hit(self):
+        return self.manifest is not None
+
+    def load_data(self):
+        titles = self.manifest['titles']
+        if len(titles) > 0:
+            keys = np.arange(len(titles))
+            values = np.array(titles, dtype='S')
+            titles = np.rec.fromarrays((keys, values), names=('key', 'value'))
+        else:
+            titles = np.array([])
+        data = np.load(os.path.join(self.entry_dir, 'data.npy'), mmap_mode='r')
+        time_cols = np.array(self.manifest['time_cols'], dtype=int)
+        return titles, data, time_cols
+
+    def save_data(self, titles, data, time_cols):
+        os.makedirs(self.entry_dir, exist_ok=True)
+        np.save(os.path.join(self.entry_dir, 'data.npy'), data)
+        manifest = {'file_hash': self.file_hash,
+                    'titles': [txt[1].decode() for txt in titles],
+                    'time_cols': [int(col) for col in time_cols],
+                    'valid_cols': None,
+                    'bins': []}
+        self.write_manifest(manifest)
+
+    def load_valid_cols(self):
+        if not self.hit or self.manifest['valid_cols'] is None:
+            return None
+        return np.array(self.manifest['valid_cols'], dtype=int)
+
+    def save_valid_cols(self, valid_cols):
+        if not self.hit:
+            return
+        manifest = dict(self.manifest)
+        manifest['valid_cols'] = [int(col) for col in valid_cols]
+        self.write_manifest(manifest)
+
+    def has_bin(self, col):
+        return self.hit and (int(col) in self.manifest['bins'])
+
+    def load_bin(self, col):
+        # bit-packed increment bin of attribute col (or None)
+        if not self.has_bin(col):
+            return None
+        return np.load(os.path.join(self.entry_dir, 'bin_' + str(int(col)) + '.npy'), mmap_mode='r')
+
+    def save_bin(self, col, bin_data):
+        if not self.hit:
+            return
+        np.save(os.path.join(self.entry_dir, 'bin_' + str(int(col)) + '.npy'), bin_data)
+        manifest = dict(self.manifest)
+        manifest['bins'] = sorted(set(manifest['bins']) | {int(col)})
+        self.write_manifest(manifest)
+
+    def write_manifest(self, manifest):
+        # the manifest is replaced last (atomically): an entry is valid once it exists
+        temp_file = os.path.join(self.entry_dir, 'manifest.json.tmp')
+        with open(temp_file, 'w') as f:
+            json.dump(manifest, f)
+        os.replace(temp_file, os.path.join(self.entry_dir, 'manifest.json'))
+        self.manifest = manifest
+
+    @staticmethod
+    def read_manifest(entry_dir):
+        try:
+            with open(os.path.join(entry_dir, 'manifest.json'), 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def hash_file(file_path, chunk_size=2 ** 20):
+        sha = hashlib.sha1()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                sha.update(chunk)
+        return sha.hexdigest()
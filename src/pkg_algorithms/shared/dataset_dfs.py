@@ -11,24 +11,48 @@ Changes
 -------
 1. This frees primary memory from storing nx1 matrices
 2. Creates an Encoded Data set
+3. Pairs with a null (NaN) value are encoded 0 and are not counted as
+   invariant in the cost matrix
+4. Identical rows are not compressed (see Dataset compress): a support counts
+   the leading tuples of pairs i < j, which depends on the order of the rows
+5. With a memory budget (mem_budget), a data set whose encoded pairs would not
+   fit is rejected before encoding
+6. CSV files may be read in chunks of chunk_rows rows (see Dataset.read_csv)
+7. Only selected columns (attributes) are parsed (see Dataset.read_csv)
+8. file_path may also be an in-memory table (see Dataset.read_frame) or a
+   columnar directory (see Dataset.read_columns)
+9. With Numba, tuple pairs are encoded into one preallocated array and the
+   costs are counted in the same pass (see kernels.py)
 
 """
 
 import numpy as np
 import gc
+from . import kernels
 from .dataset_bfs import Dataset
+from .mem_planner import MemPlanner
+from .column_store import ColumnStore
 
 
 class DatasetDFS(Dataset):
 
-    def __init__(self, file_path, min_sup=0, eq=False):
+    def __init__(self, file_path, min_sup=0, eq=False, mem_budget=None, chunk_rows=None, attributes=None,
+                 merge_dt=False):
         # super().__init__(file_path, min_sup, eq)
         self.thd_supp = min_sup
         self.equal = eq
-        self.titles, self.data = Dataset.read_csv(file_path)
+        if Dataset.is_frame(file_path):
+            self.titles, self.data, self.time_cols = Dataset.read_frame(file_path, merge_dt=merge_dt,
+                                                                        attributes=attributes)
+        elif ColumnStore.is_store(file_path):
+            self.titles, self.data, self.time_cols = Dataset.read_columns(file_path, attributes=attributes)
+        else:
+            self.titles, self.data, self.time_cols = Dataset.read_csv(file_path, merge_dt=merge_dt,
+                                                                      chunk_rows=chunk_rows, attributes=attributes)
         self.row_count, self.col_count = self.data.shape
-        self.time_cols = self.get_time_cols()
         self.attr_cols = self.get_attr_cols()
+        if mem_budget is not None:
+            MemPlanner(mem_budget).check_encoding(self.data.shape[0], len(self.attr_cols))
         self.cost_matrix = np.ones((self.col_count, 3), dtype=int)
         self.no_bins = False
         self.step_name = ''
@@ -40,6 +64,8 @@ class DatasetDFS(Dataset):
         self.attr_size = len(attr_data[self.attr_cols[0]])
         size = self.attr_size
         n = len(self.attr_cols) + 2
+        if kernels.JIT:
+            return self.encode_pairs(attr_data, size)
         encoded_data = list()
         for i in range(size):
             j = i + 1
@@ -59,7 +85,7 @@ class DatasetDFS(Dataset):
                 k += 1
                 pos_cost = np.count_nonzero(row == v)
                 neg_cost = np.count_nonzero(row == -v)
-                inv_cost = np.count_nonzero(row == 0)
+                inv_cost = 0 if np.isnan(row_in) else np.count_nonzero(row_js == row_in)
                 self.cost_matrix[col][0] += (neg_cost + inv_cost)
                 self.cost_matrix[col][1] += (pos_cost + inv_cost)
                 self.cost_matrix[col][2] += (pos_cost + neg_cost)
@@ -69,6 +95,22 @@ class DatasetDFS(Dataset):
         gc.collect()
         return np.array(encoded_data)
 
+    def encode_pairs(self, attr_data, size):
+        # compiled encode_data: same rows (i, j, items) and costs
+        k = len(self.attr_cols)
+        col_data = np.array([attr_data[col] for col in self.attr_cols], dtype=float)
+        encoded_data = np.empty((size * (size - 1) // 2, k + 2), dtype=int)
+        costs = np.zeros((k, 3), dtype=np.int64)
+        kernels.encode_pairs(col_data, self.attr_cols.astype(np.int64), encoded_data, costs)
+        for c, col in enumerate(self.attr_cols):
+            neg_cost, pos_cost, inv_cost = costs[c]
+            self.cost_matrix[col][0] += (neg_cost + inv_cost)
+            self.cost_matrix[col][1] += (pos_cost + inv_cost)
+            self.cost_matrix[col][2] += (pos_cost + neg_cost)
+        self.data = None
+        gc.collect()
+        return encoded_data
+
     def remove_inv_attrs(self, encoded_data):
         c_matrix = self.cost_matrix
         # 1. remove invalid attributes
@@ -85,3 +127,10 @@ class DatasetDFS(Dataset):
         valid_a2 = np.array(valid_a2) + 2
         encoded_data = encoded_data[:, valid_a2]
         return encoded_data
+
+    @staticmethod
+    def count_tuples(tids):
+        # number of tuples that lead a tuple pair of tids
+        if len(tids) <= 0:
+            return 0
+        return np.unique(np.array(list(tids))[:, 0]).size
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""
+@author: "Dickson Owuor"
+@credits: "Anne Laurent"
+@license: "MIT"
+@version: "1.0"
+@email: "owuordickson@gmail.com"
+@created: "18 October 2026"
+
+Dense bins (bin_type='dense'): each n x n binary rank is a boolean matrix of
+one byte per tuple pair, as in the original GRAANK. Dense bins use 8 times the
+memory of packed bins and serve mostly as a reference for the other types.
+
+Changes
+-------
+1. Joins bins with a logical AND and counts supports with count_nonzero
+2. A decrement item is the transposed view of its increment item
+3. With Numba, count_and joins and counts two bins in one pass
+
+"""
+
+import numpy as np
+
+from . import kernels
+from .packed_bin import PackedBin
+
+
+class DenseBin:
+
+    def __init__(self, bin_data, n, weights=None):
+        self.bin_data = bin_data  # boolean matrix of shape (n, n)
+        self.size = n
+        self.weights = weights  # multiplicity of each row (or None)
+
+    def __and__(self, other):
+        if not isinstance(other, DenseBin):
+            return NotImplemented
+        return DenseBin(np.logical_and(self.bin_data, other.bin_data), self.size, self.weights)
+
+    @property
+    def T(self):
+        return DenseBin(self.bin_data.T, self.size, self.weights)
+
+    @property
+    def nbytes(self):
+        return self.bin_data.nbytes
+
+    def count_and(self, other):
+        # pairs in (self & other), without building the joined bin if kernels are compiled
+        if kernels.JIT and self.weights is None and isinstance(other, DenseBin):
+            return int(kernels.count_and_dense(self.bin_data, other.bin_data))
+        return (self & other).count()
+
+    def count(self):
+        if self.weights is None:
+            return int(np.count_nonzero(self.bin_data))
+        return PackedBin.count_weights(self.bin_data, self.weights)
+
+    def copy(self):
+        return DenseBin(self.bin_data.copy(), self.size, self.weights)
+
+    def unpack(self):
+        return self.bin_data
+
+    @staticmethod
+    def bin_rank(col_data, equal=False, weights=None):
+        # with weights (distinct rows), the diagonal is kept: equal rows are ordered both ways
+        n = col_data.size
+        with np.errstate(invalid='ignore'):
+            if not equal:
+                bin_data = col_data < col_data[:, np.newaxis]
+            else:
+                bin_data = col_data <= col_data[:, np.newaxis]
+                if weights is None:
+                    np.fill_diagonal(bin_data, False)
+        return DenseBin(bin_data, n, weights)
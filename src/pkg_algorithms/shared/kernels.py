@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""
+@author: "Dickson Owuor"
+@credits: "Anne Laurent"
+@license: "MIT"
+@version: "1.0"
+@email: "owuordickson@gmail.com"
+@created: "18 October 2026"
+
+Compiled kernels (Numba, if it is installed). Each kernel fuses a compare,
+AND or count with the loop that consumes it, so that no temporary array is
+allocated: bins are compared and packed in one pass, joined and counted in one
+pass, and tuple pairs are encoded straight into their output array.
+
+Without Numba, JIT is False and callers keep their NumPy code.
+
+Changes
+-------
+1. pack_rank: binary rank of a block of rows, packed 8 pairs per byte
+2. count_bits and count_and: popcount of a packed bin, and of the AND of two
+   packed bins (laid out alike, see PackedBin.get_data)
+3. count_and_dense: count of the AND of two boolean bins
+4. encode_pairs: tuple-pair encoding and item costs of DatasetDFS (LCM)
+
+"""
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+# Kernels are used if Numba is installed
+JIT = numba is not None
+
+# Number of set bits for every possible byte value
+POP_COUNT = np.array([bin(i).count('1') for i in range(256)], dtype=np.int64)
+
+
+def njit(func):
+    # compiled on first call (and cached on disk); the plain function without Numba
+    if numba is None:
+        return func
+    return numba.njit(cache=True, nogil=True)(func)
+
+
+@njit
+def pack_rank(col_data, start, stop, equal, keep_diag, out):
+    # rows [start, stop) of the binary rank of col_data: bit (i, j) is set if col_data[j] < col_data[i]
+    # (or <=). Bits are packed as np.packbits does (first column in the highest bit); null values compare false
+    n = col_data.size
+    for i in range(start, stop):
+        x_i = col_data[i]
+        r = i - start
+        for jb in range(out.shape[1]):
+            byte = 0
+            for k in range(8):
+                j = jb * 8 + k
+                if j < n:
+                    x_j = col_data[j]
+                    if equal:
+                        hit = (x_j <= x_i) and (keep_diag or j != i)
+                    else:
+                        hit = x_j < x_i
+                    if hit:
+                        byte |= (128 >> k)
+            out[r, jb] = byte
+
+
+@njit
+def count_bits(bin_data):
+    total = 0
+    for i in range(bin_data.shape[0]):
+        for jb in range(bin_data.shape[1]):
+            total += POP_COUNT[bin_data[i, jb]]
+    return total
+
+
+@njit
+def count_and(a_data, b_data):
+    # pairs in (A & B) of two packed bins laid out alike
+    total = 0
+    for i in range(a_data.shape[0]):
+        for jb in range(a_data.shape[1]):
+            total += POP_COUNT[a_data[i, jb] & b_data[i, jb]]
+    return total
+
+
+@njit
+def count_and_dense(a_data, b_data):
+    total = 0
+    for i in range(a_data.shape[0]):
+        for j in range(a_data.shape[1]):
+            if a_data[i, j] and b_data[i, j]:
+                total += 1
+    return total
+
+
+@njit
+def encode_pairs(attr_data, attr_cols, out, costs):
+    # one row [i, j, +/-(col + 1) or 0, ...] per tuple pair i < j of attr_data (attributes as rows) and the
+    # decreasing, increasing and invariant pairs of every attribute
+    k, size = attr_data.shape
+    r = 0
+    for i in range(size):
+        for j in range(i + 1, size):
+            out[r, 0] = i
+            out[r, 1] = j
+            for c in range(k):
+                x_i = attr_data[c, i]
+                x_j = attr_data[c, j]
+                v = attr_cols[c] + 1
+                if x_j > x_i:
+                    out[r, c + 2] = v
+                    costs[c, 1] += 1
+                elif x_j < x_i:
+                    out[r, c + 2] = -v
+                    costs[c, 0] += 1
+                else:
+                    out[r, c + 2] = 0
+                    if x_j == x_i:
+                        costs[c, 2] += 1
+            r += 1
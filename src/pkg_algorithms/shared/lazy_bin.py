@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""
+@author: "Dickson Owuor"
+@credits: "Anne Laurent"
+@license: "MIT"
+@version: "1.0"
+@email: "owuordickson@gmail.com"
+@created: "18 October 2026"
+
+Lazy bins (bin_type='lazy'). The bin of a gradual item is built from its column
+the first time it is used and kept in an LRU cache with a byte budget; the
+least recently used bins are evicted (and built again when they are needed),
+so that resident single-item bins never exceed the budget however many
+attributes are valid.
+
+Changes
+-------
+1. BinLRU caches the (increment) bin of every attribute under a byte budget
+2. LazyBin stands in for a bin (or its transpose) and builds it on use
+
+"""
+
+from collections import OrderedDict
+
+
+# Default byte budget of the cached bins
+LRU_BYTES = 2 ** 28
+
+
+class BinLRU:
+
+    def __init__(self, build_bin, max_bytes=LRU_BYTES):
+        self.build_bin = build_bin  # function: attribute column -> its increment bin
+        self.max_bytes = int(max_bytes)
+        self.bins = OrderedDict()  # column -> bin, least recently used first
+        self.nbytes = 0
+        self.builds = 0  # bins built (again) so far
+
+    def get(self, col):
+        if col in self.bins:
+            self.bins.move_to_end(col)
+            return self.bins[col]
+        col_bin = self.build_bin(col)
+        self.builds += 1
+        self.bins[col] = col_bin
+        # a cached bin grows when its transpose is laid out (see PackedBin.get_data)
+        self.nbytes = sum(any_bin.nbytes for any_bin in self.bins.values())
+        # the newest bin is kept even if it alone exceeds the budget
+        while (self.nbytes > self.max_bytes) and (len(self.bins) > 1):
+            _, old_bin = self.bins.popitem(last=False)
+            self.nbytes -= old_bin.nbytes
+        return col_bin
+
+
+class LazyBin:
+
+    def __init__(self, lru, col, transposed=False):
+        self.lru = lru
+        self.col = col
+        self.transposed = transposed  # decrement item: the transpose of the increment bin
+
+    def get(self):
+        col_bin = self.lru.get(self.col)
+        return col_bin.T if self.transposed else col_bin
+
+    def __and__(self, other):
+        return self.get() & LazyBin.resolve(other)
+
+    def __rand__(self, other):
+        return other & self.get()
+
+    @property
+    def T(self):
+        return LazyBin(self.lru, self.col, not self.transposed)
+
+    @property
+    def nbytes(self):
+        # held by the LRU cache
+        return 0
+
+    def count_and(self, other):
+        return self.get().count_and(LazyBin.resolve(other))
+
+    def count(self):
+        return self.get().count()
+
+    def copy(self):
+        return self.get().copy()
+
+    def unpack(self):
+        return self.get().unpack()
+
+    @staticmethod
+    def resolve(any_bin):
+        return any_bin.get() if isinstance(any_bin, LazyBin) else any_bin
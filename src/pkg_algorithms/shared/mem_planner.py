@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+"""
+@author: "Dickson Owuor"
+@credits: "Anne Laurent"
+@license: "MIT"
+@version: "1.0"
+@email: "owuordickson@gmail.com"
+@created: "18 October 2026"
+
+Memory-budget planner. Estimates the footprint of every bin representation from
+the row count, the number of attributes that survive the tie-count pre-screen and
+the tile size, and chooses the representation of least estimated cost that
+fits a budget (or fails before any bin is allocated).
+
+Changes
+-------
+1. Estimates resident memory (and scratch disk for memmap) of packed, memmap,
+   rank, blocked and sampled bins; BIN_TYPES lists them fastest first
+2. Estimates the encoded pairs of DatasetDFS (LCM) against the budget
+3. Estimates dense (boolean) bins
+4. Estimates lazy bins (see lazy_bin.py), which need room for the two bins of
+   a join only; get_lru_bytes() gives them the rest of the budget
+5. Estimates count one tile per thread (n_jobs) and the joined bins held while
+   mining: WORK_BINS, or every candidate of level 2 for GRAANK (get_apriori_bins)
+6. Packed, memmap and lazy estimates count the transposed copy of the bin of
+   every attribute (see PackedBin.get_data)
+7. Bin types are ranked by an estimated cost (estimate_costs): O(n^2) bytes
+   for matrix bins against O(n log^2 n) for rank supports. bin_type='auto'
+   takes the cheapest type that fits; any other bin type must fit
+
+"""
+
+import math
+import re
+import shutil
+import tempfile
+from .packed_bin import TILE_BYTES
+
+
+# Bin representations (sampled supports are estimates); 'auto' chooses one of them
+BIN_TYPES = ['packed', 'dense', 'memmap', 'lazy', 'rank', 'blocked', 'sampled']
+
+# Bins held besides the single-item bins while mining (joins of two bins)
+WORK_BINS = 2
+
+# Costs (estimate_costs) are in bytes of packed bin streamed by a join. Measured with NumPy: a support count
+# with rank supports takes RANK_COST * n * log2(n)^2, building and transposing the bin of an attribute
+# BUILD_COST packed bins, and a join of bins read from disk (memmap) DISK_COST times a join in memory
+RANK_COST = 24
+BUILD_COST = 3
+DISK_COST = 4
+
+
+class MemPlanner:
+
+    def __init__(self, mem_budget, tile_bytes=TILE_BYTES, scratch_dir=None):
+        self.mem_budget = MemPlanner.parse_size(mem_budget)  # bytes
+        self.tile_bytes = int(tile_bytes)
+        self.scratch_dir = scratch_dir
+
+    def estimate(self, n, u, col_count, k, m_pairs, n_jobs=1, work_bins=WORK_BINS):
+        # (memory, disk) bytes of every bin type: n tuples, u (distinct) rows of col_count columns, k valid
+        # attributes, m_pairs sampled pairs, n_jobs threads (one tile each) and work_bins joined bins
+        data_bytes = u * col_count * 8
+        one_bin = u * ((u + 7) // 8)
+        # the bin of an attribute and its transpose (decrement item), plus the joined bins
+        bin_bytes = (2 * k + work_bins) * one_bin
+        expand_bytes = (n * col_count * 8) if n != u else 0
+        tile_bytes = max(1, n_jobs) * min(self.tile_bytes, 2 * u * u)  # a tile never exceeds the whole bin
+        return {
+            'packed': (data_bytes + bin_bytes + tile_bytes, 0),
+            'dense': (data_bytes + (k + work_bins) * u * u, 0),
+            'memmap': (data_bytes + 2 * tile_bytes, bin_bytes),
+            # at least the bins (and transposes) of two attributes are cached
+            'lazy': (data_bytes + (4 + work_bins) * one_bin + tile_bytes, 0),
+            # ranks of every attribute, plus the merge/CDQ buffers of a pattern
+            'rank': (data_bytes + expand_bytes + 3 * k * n * 8, 0),
+            'blocked': (data_bytes + (k + work_bins) * u * 8 + tile_bytes, 0),
+            'sampled': (data_bytes + 2 * m_pairs * 8 + 2 * (k + work_bins) * m_pairs, 0),
+        }
+
+    def estimate_costs(self, n, u, k, lru_bytes=None):
+        # relative time of every exact bin type (see RANK_COST): building the bins of k attributes, then one
+        # support count for each of the k(2k - 1) candidates of level 2. lru_bytes: cache of lazy bins
+        one_bin = u * ((u + 7) // 8)
+        counts = max(1, MemPlanner.get_apriori_bins(k))
+        packed_cost = (BUILD_COST * k + counts) * one_bin
+        # lazy: the two bins of a join are rebuilt whenever the cache (bins and transposes) misses them
+        cached = k if lru_bytes is None else (lru_bytes // (2 * one_bin))
+        miss_rate = max(0.0, 1.0 - float(cached) / max(k, 1))
+        return {
+            'packed': packed_cost,
+            'dense': (BUILD_COST * k + 8 * counts) * one_bin,
+            'memmap': DISK_COST * packed_cost,
+            'lazy': packed_cost + counts * 2 * miss_rate * BUILD_COST * one_bin,
+            'rank': counts * RANK_COST * n * math.log2(max(n, 2)) ** 2,
+            'blocked': counts * 3 * one_bin,
+        }
+
+    def choose(self, estimates, costs, bin_type='auto'):
+        # bin_type='auto': the exact bin type of least cost that fits (sampled if no exact type fits);
+        # otherwise bin_type itself if it fits
+        if bin_type == 'auto':
+            candidates = sorted((b for b in BIN_TYPES if b != 'sampled'), key=lambda x: costs[x]) + ['sampled']
+        else:
+            candidates = [bin_type]
+        disk_free = self.get_disk_free()
+        for b in candidates:
+            mem_bytes, disk_bytes = estimates[b]
+            if mem_bytes <= self.mem_budget and disk_bytes <= disk_free:
+                return b
+        b = min(candidates, key=lambda x: estimates[x][0])
+        if estimates[b][0] <= self.mem_budget:
+            raise MemoryError(b + ' bins need ' + MemPlanner.format_size(estimates[b][1]) +
+                              ' of scratch disk, ' + MemPlanner.format_size(disk_free) + ' is free')
+        raise MemoryError('bins need at least ' + MemPlanner.format_size(estimates[b][0]) + ' (' + b +
+                          '), the memory budget is ' + MemPlanner.format_size(self.mem_budget))
+
+    def get_lru_bytes(self, u, col_count, n_jobs=1, work_bins=WORK_BINS):
+        # budget of the cached bins (bin_type='lazy'): the memory left by the data, the joins and the tiles
+        one_bin = u * ((u + 7) // 8)
+        tile_bytes = max(1, n_jobs) * min(self.tile_bytes, 2 * u * u)
+        return max(4 * one_bin, self.mem_budget - u * col_count * 8 - work_bins * one_bin - tile_bytes)
+
+    @staticmethod
+    def get_apriori_bins(k):
+        # joined bins of level 2 that GRAANK may hold: C(2k, 2) pairs of the 2k items of k attributes
+        return k * (2 * k - 1)
+
+    def check_encoding(self, n, k):
+        # DatasetDFS encodes every tuple pair as one row of k + 2 integers (list of rows, then one array)
+        pairs = n * (n - 1) // 2
+        enc_bytes = pairs * ((k + 2) * 8 * 2 + 112)
+        if enc_bytes > self.mem_budget:
+            raise MemoryError('encoded tuple pairs need about ' + MemPlanner.format_size(enc_bytes) +
+                              ', the memory budget is ' + MemPlanner.format_size(self.mem_budget))
+        return enc_bytes
+
+    def get_disk_free(self):
+        try:
+            return shutil.disk_usage(self.scratch_dir or tempfile.gettempdir()).free
+        except OSError:
+            return 0
+
+    @staticmethod
+    def parse_size(size):
+        # bytes of a size such as 512M, 4G, 1.5GB or a plain number of bytes
+        if isinstance(size, (int, float)):
+            return int(size)
+        match = re.fullmatch(r'\s*([0-9]*\.?[0-9]+)\s*([KMGT]?)I?B?\s*', str(size).upper())
+        if match is None:
+            raise ValueError('invalid memory size: ' + str(size))
+        power = ' KMGT'.index(match.group(2) or ' ')
+        return int(float(match.group(1)) * (1024 ** power))
+
+    @staticmethod
+    def format_size(n_bytes):
+        if n_bytes <= 0:
+            return '0 B'
+        power = min(4, int(math.log(n_bytes, 1024)))
+        return str(round(n_bytes / (1024 ** power), 1)) + ' ' + ['B', 'KB', 'MB', 'GB', 'TB'][power]
@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+"""
+@author: "Dickson Owuor"
+@credits: "Anne Laurent"
+@license: "MIT"
+@version: "1.0"
+@email: "owuordickson@gmail.com"
+@created: "18 October 2026"
+
+Bit-packed binary matrices for gradual items (8 tuple pairs per byte).
+
+Changes
+-------
+1. Stores each n x n binary rank as n rows of ceil(n/8) bytes
+2. Joins bins with bitwise AND and counts supports with a popcount
+3. A decrement item shares the bytes of its increment item through a
+   transpose flag (zero-copy view), halving resident bin memory
+4. Bins are built, joined and counted one block of rows at a time, and may
+   live in an on-disk BinStore (see bin_store.py)
+5. Bins of distinct rows with multiplicities (weights): entry (a, b) stands
+   for w[a] * w[b] tuple pairs, the diagonal for w[a] * (w[a] - 1)
+6. With Numba, ranks are compared and packed, and bins are counted (count_and:
+   joined and counted), in single passes (see kernels.py)
+7. A transposed bin is transposed in memory (8 x 8 bit blocks) once, on its
+   first join with a bin of the other orientation, and the copy is shared by
+   the bin and its transpose; joined bins are never transposed
+
+"""
+
+import numpy as np
+
+from . import kernels
+
+# Number of set bits for every possible byte value
+POP_COUNT = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+# Default memory budget (bytes) for one tile of unpacked comparisons
+TILE_BYTES = 2 ** 26
+
+
+class PackedBin:
+
+    def __init__(self, bin_data, n, transposed=False, store=None, tile_rows=None, weights=None, flipped=None):
+        self.bin_data = bin_data  # uint8 matrix of shape (n, ceil(n/8))
+        self.size = n
+        self.transposed = transposed  # bin is the transpose of bin_data
+        self.store = store  # BinStore that allocates on-disk bins (or None)
+        self.tile_rows = tile_rows if tile_rows else PackedBin.get_block_size(n)
+        self.weights = weights  # multiplicity of each row (or None)
+        # [transpose of bin_data, or None until a join needs it], shared with the transpose of the bin
+        self.flipped = flipped if flipped is not None else [None]
+
+    def __and__(self, other):
+        # rows are joined one block at a time, so on-disk bins are streamed.
+        # (A.T & B.T) = (A & B).T; otherwise the transposed bin is laid out in memory once
+        if not isinstance(other, PackedBin):
+            return NotImplemented
+        n = self.size
+        transposed = self.transposed and other.transposed
+        self_data, other_data = self.get_data(transposed), other.get_data(transposed)
+        bin_data = PackedBin.empty(n, self.store)
+        step = self.tile_rows
+        for start in range(0, n, step):
+            stop = min(n, start + step)
+            np.bitwise_and(self_data[start:stop], other_data[start:stop], out=bin_data[start:stop])
+        return PackedBin(bin_data, n, transposed, self.store, self.tile_rows, self.weights)
+
+    @property
+    def T(self):
+        return PackedBin(self.bin_data, self.size, not self.transposed, self.store, self.tile_rows, self.weights,
+                         self.flipped)
+
+    @property
+    def nbytes(self):
+        if self.flipped[0] is None:
+            return self.bin_data.nbytes
+        return self.bin_data.nbytes + self.flipped[0].nbytes
+
+    def count_and(self, other):
+        # pairs in (self & other), without building the joined bin if kernels are compiled
+        if kernels.JIT and self.weights is None and isinstance(other, PackedBin):
+            transposed = self.transposed and other.transposed
+            return int(kernels.count_and(np.asarray(self.get_data(transposed)),
+                                         np.asarray(other.get_data(transposed))))
+        return (self & other).count()
+
+    def get_data(self, transposed=False):
+        # bytes of the bin laid out as rows (transposed=False) or as columns (transposed=True)
+        if transposed == self.transposed:
+            return self.bin_data
+        if self.flipped[0] is None:
+            n = self.size
+            flip_data = PackedBin.empty(n, self.store)
+            for start in range(0, n, self.tile_rows):
+                stop = min(n, start + self.tile_rows)
+                flip_data[start:stop] = PackedBin.transpose_rows(self.bin_data, n, start, stop)
+            self.flipped[0] = flip_data
+        return self.flipped[0]
+
+    def count(self):
+        bin_sum = 0
+        step = self.tile_rows
+        for start in range(0, self.size, step):
+            if self.weights is None:
+                bin_sum += PackedBin.count_bits(self.bin_data[start:(start + step)])
+            else:
+                stop = min(self.size, start + step)
+                rows = np.unpackbits(self.bin_data[start:stop], axis=1, count=self.size)
+                bin_sum += PackedBin.count_weights(rows, self.weights, start)
+        return bin_sum
+
+    def copy(self):
+        bin_data = PackedBin.empty(self.size, self.store)
+        bin_data[:] = self.bin_data
+        return PackedBin(bin_data, self.size, self.transposed, self.store, self.tile_rows, self.weights)
+
+    def unpack(self):
+        bool_data = np.unpackbits(self.bin_data, axis=1, count=self.size).astype(bool)
+        return bool_data.T if self.transposed else bool_data
+
+    @staticmethod
+    def pack(bool_data):
+        return PackedBin(np.packbits(bool_data, axis=1), bool_data.shape[1])
+
+    @staticmethod
+    def bin_rank(col_data, equal=False, store=None, tile_rows=None, weights=None):
+        # binary rank of a column, compared and packed one block of rows at a time.
+        # With weights (distinct rows), the diagonal is kept: equal rows are ordered both ways
+        n = col_data.size
+        bin_data = PackedBin.empty(n, store)
+        step = tile_rows if tile_rows else PackedBin.get_block_size(n)
+        if kernels.JIT:
+            for start in range(0, n, step):
+                stop = min(n, start + step)
+                kernels.pack_rank(col_data, start, stop, equal, weights is not None, np.asarray(bin_data[start:stop]))
+            return PackedBin(bin_data, n, store=store, tile_rows=step, weights=weights)
+        with np.errstate(invalid='ignore'):
+            for start in range(0, n, step):
+                stop = min(n, start + step)
+                if not equal:
+                    temp_pos = col_data < col_data[start:stop, np.newaxis]
+                else:
+                    temp_pos = col_data <= col_data[start:stop, np.newaxis]
+                    if weights is None:
+                        temp_pos[np.arange(stop - start), np.arange(start, stop)] = False
+                bin_data[start:stop] = np.packbits(temp_pos, axis=1)
+        return PackedBin(bin_data, n, store=store, tile_rows=step, weights=weights)
+
+    @staticmethod
+    def empty(n, store=None):
+        shape = (n, (n + 7) // 8)
+        if store is None:
+            return np.empty(shape, dtype=np.uint8)
+        return store.create(shape)
+
+    @staticmethod
+    def count_bits(bin_data):
+        if kernels.JIT:
+            return int(kernels.count_bits(np.asarray(bin_data)))
+        if hasattr(np, 'bitwise_count'):
+            # numpy >= 2.0
+            return int(np.sum(np.bitwise_count(bin_data), dtype=np.int64))
+        return int(np.sum(POP_COUNT[bin_data], dtype=np.int64))
+
+    @staticmethod
+    def count_weights(rows, weights, start=0):
+        # tuple pairs in rows [start, start + len(rows)) of a bin of distinct rows. Rows are cast to int64 an
+        # eighth at a time, so that the cast needs no more memory than rows
+        stop = start + len(rows)
+        w = weights[start:stop]
+        diag = rows[np.arange(stop - start), np.arange(start, stop)]
+        step = max(1, (len(rows) + 7) // 8)
+        row_sums = np.empty(len(rows), dtype=np.int64)
+        for i in range(0, len(rows), step):
+            row_sums[i:(i + step)] = rows[i:(i + step)].astype(np.int64) @ weights
+        return int(np.dot(w, row_sums) - np.dot(w, diag))
+
+    @staticmethod
+    def transpose_rows(bin_data, n, start, stop):
+        # rows [start, stop) of the transpose are columns [start, stop) of bin_data (start is a multiple of 8).
+        # Each 8 x 8 block of bits is read as one 64-bit word (first row in the highest byte) and transposed
+        # with three masked swaps (Hacker's Delight, 7-3)
+        n_bytes = bin_data.shape[1]
+        col_start, col_stop = start // 8, (stop + 7) // 8
+        width = col_stop - col_start
+        blocks = np.zeros((8 * n_bytes, width), dtype=np.uint8)
+        blocks[:n] = bin_data[:, col_start:col_stop]
+        blocks = np.ascontiguousarray(blocks.reshape(n_bytes, 8, width).transpose(0, 2, 1))
+        x = blocks.view('>u8')[..., 0].astype(np.uint64)
+        for shift, mask in ((7, 0x00AA00AA00AA00AA), (14, 0x0000CCCC0000CCCC), (28, 0x00000000F0F0F0F0)):
+            t = np.bitwise_and(x ^ (x >> np.uint64(shift)), np.uint64(mask))
+            x ^= t
+            x ^= t << np.uint64(shift)
+        blocks = x.astype('>u8').view(np.uint8).reshape(n_bytes, width, 8)
+        return blocks.transpose(1, 2, 0).reshape(8 * width, n_bytes)[:(stop - start)]
+
+    @staticmethod
+    def get_block_size(n, block_bytes=TILE_BYTES):
+        # rows per block (multiple of 8) so that an unpacked n-wide block fits block_bytes
+        return max(8, (int(block_bytes) // max(n, 1)) // 8 * 8)
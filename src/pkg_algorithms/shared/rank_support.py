@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+"""
+@author: "Dickson Owuor"
+@credits: "Anne Laurent"
+@license: "MIT"
+@version: "1.0"
+@email: "owuordickson@gmail.com"
+@created: "18 October 2026"
+
+Rank-based exact support engine. Only per-attribute ranks are stored; no n x n
+binary matrix is ever built.
+
+Changes
+-------
+1. Single-item supports follow from tie counts of each attribute
+2. Pairwise supports are concordant (or discordant) pair counts, obtained in
+   O(n log n) per merge level by counting ascents of one rank sequence sorted
+   on the other attribute
+3. Supports of k > 2 items are k-dimensional dominance counts, obtained by
+   CDQ divide-and-conquer over the ranks in O(n log^(k-1) n)
+4. Null (NaN) values are masked: a tuple with a null in any attribute of a
+   pattern takes part in no pair of that pattern
+
+"""
+
+import numpy as np
+
+
+class RankSupport:
+
+    def __init__(self, attr_data, attr_cols, eq=False):
+        self.equal = eq
+        self.attr_size = len(attr_data[attr_cols[0]])
+        self.ranks = dict()
+        self.nulls = dict()  # null mask of each column that has nulls
+        for col in attr_cols:
+            col_data = np.array(attr_data[col], dtype=float)
+            null_mask = np.isnan(col_data)
+            ranks = np.zeros(col_data.size, dtype=np.int64)
+            ranks[~null_mask] = np.unique(col_data[~null_mask], return_inverse=True)[1].reshape(-1)
+            self.ranks[col] = ranks
+            if np.any(null_mask):
+                self.nulls[col] = null_mask
+
+    def get_coords(self, gi):
+        # A pair of tuples (i, j) lies in the bin of gi iff coords[j] < coords[i]
+        col, sym = gi[0], gi[1]
+        if isinstance(sym, bytes):
+            sym = sym.decode()
+        if sym == '-':
+            return -self.ranks[col]
+        return self.ranks[col]
+
+    def get_valid_rows(self, gi_list):
+        # rows without a null in any attribute of gi_list (None: all rows)
+        valid = None
+        for gi in gi_list:
+            null_mask = self.nulls.get(gi[0])
+            if null_mask is not None:
+                valid = ~null_mask if valid is None else (valid & ~null_mask)
+        return valid
+
+    def count_item(self, gi):
+        x = self.get_coords(gi)
+        valid = self.get_valid_rows([gi])
+        if valid is not None:
+            x = x[valid]
+        n = x.size
+        ties = RankSupport.count_ties(x)
+        if self.equal:
+            # tied tuples are ordered in both directions
+            return int(n * (n - 1) / 2 + ties)
+        return int(n * (n - 1) / 2 - ties)
+
+    def count_pair(self, gi_1, gi_2):
+        x = self.get_coords(gi_1)
+        y = self.get_coords(gi_2)
+        valid = self.get_valid_rows([gi_1, gi_2])
+        if valid is not None:
+            x = x[valid]
+            y = y[valid]
+        if x.size < 2:
+            return 0
+        if self.equal:
+            order = np.lexsort((y, x))
+            span = int(y.max() - y.min()) + 1
+            ties = RankSupport.count_ties(x * span + (y - y.min()))
+            return RankSupport.count_ascents(y[order], weak=True) + ties
+        else:
+            # descending y within tied x, so that tied x never form an ascent
+            order = np.lexsort((-y, x))
+            return RankSupport.count_ascents(y[order])
+
+    def count_pattern(self, gi_list):
+        if len(gi_list) == 1:
+            return self.count_item(gi_list[0])
+        elif len(gi_list) == 2:
+            return self.count_pair(gi_list[0], gi_list[1])
+        # k-dimensional dominance: x[j] < x[i] (or <=) in every coordinate.
+        # Doubled coordinates turn the weak test into a strict one between
+        # the j-copy (2x) and the i-copy (2x + 1) of the points
+        coords = np.column_stack([self.get_coords(gi) for gi in gi_list]) * 2
+        valid = self.get_valid_rows(gi_list)
+        if valid is not None:
+            coords = coords[valid]
+        n = len(coords)
+        if self.equal:
+            # every tuple weakly dominates itself
+            return RankSupport.count_dominance(coords, coords + 1) - n
+        return RankSupport.count_dominance(coords, coords)
+
+    def rows_bin(self, x, start, stop):
+        # rows [start, stop) of the binary rank of coordinates x
+        if self.equal:
+            temp_pos = x <= x[start:stop, np.newaxis]
+            temp_pos[np.arange(stop - start), np.arange(start, stop)] = False
+        else:
+            temp_pos = x < x[start:stop, np.newaxis]
+        return temp_pos
+
+    @staticmethod
+    def count_ties(x):
+        counts = np.unique(x, return_counts=True)[1].astype(np.int64)
+        return int(np.sum(counts * (counts - 1) // 2))
+
+    @staticmethod
+    def count_ascents(y, weak=False, left_mask=None, right_mask=None):
+        # number of positions p < q with y[p] < y[q] (or y[p] <= y[q] if weak),
+        # counted by bottom-up merge sort: at every level, each element of a
+        # right run is located in the sorted left run of the same block.
+        # Masks restrict p (left_mask) and q (right_mask) to subsets
+        n = len(y)
+        if n < 2:
+            return 0
+        side = 'right' if weak else 'left'
+        y = np.asarray(y, dtype=np.int64) - np.min(y)
+        span = int(np.max(y)) + 1
+        idx = np.arange(n)
+        total = 0
+        width = 1
+        while width < n:
+            block = idx // (2 * width)
+            is_right = ((idx // width) % 2) == 1
+            is_left = ~is_right
+            is_query = is_right
+            if left_mask is not None:
+                is_left = is_left & left_mask
+            if right_mask is not None:
+                is_query = is_query & right_mask
+            keys = block * span + y
+            left_keys = keys[is_left]
+            offset = np.searchsorted(left_keys, block[is_query] * span, side='left')
+            total += int(np.sum(np.searchsorted(left_keys, keys[is_query], side=side) - offset))
+            if left_mask is None and right_mask is None:
+                y = np.sort(keys, kind='stable') - block * span
+            else:
+                order = np.argsort(keys, kind='stable')
+                y = y[order]
+                if left_mask is not None:
+                    left_mask = left_mask[order]
+                if right_mask is not None:
+                    right_mask = right_mask[order]
+            width *= 2
+        return total
+
+    @staticmethod
+    def count_dominance(a, b):
+        # number of pairs (p, q) with a[p] < b[q] in every column
+        if len(a) == 0 or len(b) == 0:
+            return 0
+        d = a.shape[1]
+        if len(a) * len(b) * d <= 2 ** 18:
+            return int(np.count_nonzero(np.all(a[:, np.newaxis, :] < b[np.newaxis, :, :], axis=2)))
+        if d == 1:
+            return int(np.sum(np.searchsorted(np.sort(a[:, 0]), b[:, 0], side='left')))
+        if d == 2:
+            # sweep on column 0 (b before a on ties), count ascents of column 1
+            points = np.concatenate((a, b))
+            is_a = np.concatenate((np.ones(len(a), dtype=bool), np.zeros(len(b), dtype=bool)))
+            order = np.lexsort((is_a, points[:, 0]))
+            return RankSupport.count_ascents(points[order, 1], left_mask=is_a[order], right_mask=~is_a[order])
+
+        # CDQ: split on column 0; pairs from the low half of a to the high half
+        # of b already satisfy column 0 and lose one dimension
+        values = np.concatenate((a[:, 0], b[:, 0]))
+        mid = np.partition(values, len(values) // 2)[len(values) // 2]
+        if not np.any(values < mid):
+            higher = values[values > mid]
+            if higher.size <= 0:
+                # column 0 is constant, no strict pair
+                return 0
+            mid = np.min(higher)
+        a_lo = a[:, 0] < mid
+        b_lo = b[:, 0] < mid
+        total = RankSupport.count_dominance(a[a_lo], b[b_lo])
+        total += RankSupport.count_dominance(a[~a_lo], b[~b_lo])
+        total += RankSupport.count_dominance(a[a_lo][:, 1:], b[~b_lo][:, 1:])
+        return total
+
+
+class RankBin:
+
+    def __init__(self, r_sup, gi_list):
+        self.r_sup = r_sup
+        self.gi_list = list(gi_list)
+        self.size = r_sup.attr_size
+
+    def __and__(self, other):
+        return RankBin(self.r_sup, self.gi_list + other.gi_list)
+
+    @property
+    def nbytes(self):
+        return 0
+
+    def count_and(self, other):
+        return (self & other).count()
+
+    def count(self):
+        return self.r_sup.count_pattern(self.gi_list)
+
+    def copy(self):
+        return RankBin(self.r_sup, self.gi_list)
+
+    def unpack(self):
+        n = self.size
+        temp_bin = np.ones((n, n), dtype=bool)
+        for gi in self.gi_list:
+            temp_bin &= self.r_sup.rows_bin(self.r_sup.get_coords(gi), 0, n)
+        valid = self.r_sup.get_valid_rows(self.gi_list)
+        if valid is not None:
+            temp_bin &= valid[:, np.newaxis] & valid[np.newaxis, :]
+        return temp_bin
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""
+@author: "Dickson Owuor"
+@credits: "Anne Laurent"
+@license: "MIT"
+@version: "1.0"
+@email: "owuordickson@gmail.com"
+@created: "18 October 2026"
+
+Sliding window over a stream of rows. The window holds the last W rows in a
+ring buffer and the tuple-pair counts of its tracked patterns. When a row
+arrives, the pairs of the row that leaves are subtracted and the pairs of the
+new row are added: an update costs O(W) per tracked pattern and no bin is kept.
+Patterns are (re-)discovered by mining the full window every refresh rows.
+
+Changes
+-------
+1. Ring buffer of W rows with the pair counts of the tracked patterns
+2. get_dataset() gives the rows of the window as a data set to be mined, with
+   rank bins by default (O(W k) memory, exact)
+3. bin_type='auto' is rank; the mined windows may be held to a memory budget
+   (mem_budget)
+
+"""
+
+import numpy as np
+from .dataset_bfs import Dataset
+from .rank_support import RankSupport
+
+
+class SlidingWindow:
+
+    def __init__(self, window, min_sup, attr_cols, eq=False, refresh=None, bin_type='auto', n_jobs=1,
+                 mem_budget=None):
+        if int(window) < 2:
+            raise Exception("a window needs at least 2 rows")
+        self.window = int(window)  # W
+        self.thd_supp = min_sup
+        self.attr_cols = np.array(attr_cols, dtype=int)
+        self.equal = eq
+        self.refresh = self.window if refresh is None else int(refresh)  # rows between two minings
+        self.bin_type = 'rank' if bin_type == 'auto' else bin_type  # bins of the mined windows
+        self.n_jobs = n_jobs
+        self.mem_budget = mem_budget  # memory budget of a mined window (None: no budget)
+        self.rows = None  # ring buffer (W rows); empty slots hold nulls, which take part in no pair
+        self.slot = 0  # slot of the next row (the oldest row once the window is full)
+        self.size = 0
+        self.arrived = 0
+        self.tracked = dict()  # pattern (tuples) -> [GP, number of tuple pairs]
+
+    @property
+    def n_pairs(self):
+        return float(self.size * (self.size - 1.0) / 2.0)
+
+    def push(self, row):
+        # slides the window by one row; returns True when the window is due to be mined: once it is
+        # full, then every refresh rows
+        row = np.asarray(row, dtype=float).reshape(-1)
+        if self.rows is None:
+            self.rows = np.full((self.window, row.size), np.nan)
+        slot = self.slot
+        for key, obj in self.tracked.items():
+            coords = Dataset.pattern_coords(self.rows, key)
+            others = np.delete(coords, slot, axis=0)
+            obj[1] -= Dataset.count_row_pairs(others, coords[slot], self.equal)
+            obj[1] += Dataset.count_row_pairs(others, Dataset.pattern_coords(row[np.newaxis, :], key)[0],
+                                              self.equal)
+        self.rows[slot] = row
+        self.slot = (slot + 1) % self.window
+        self.size = min(self.size + 1, self.window)
+        self.arrived += 1
+        return (self.size == self.window) and ((self.arrived - self.window) % self.refresh == 0)
+
+    def get_dataset(self):
+        # rows of the window (in arrival order) as a data set; only the attribute columns are mined
+        if self.size < self.window:
+            data = self.rows[:self.size]
+        else:
+            data = np.concatenate((self.rows[self.slot:], self.rows[:self.slot]))
+        d_set = Dataset(data, self.thd_supp, self.equal, bin_type=self.bin_type, n_jobs=self.n_jobs,
+                        mem_budget=self.mem_budget)
+        d_set.time_cols = np.setdiff1d(np.arange(data.shape[1]), self.attr_cols)
+        d_set.attr_cols = self.attr_cols
+        return d_set
+
+    def track_patterns(self, lst_gp):
+        # replaces the tracked patterns with (freshly mined) lst_gp and their exact pair counts
+        data = self.rows if self.size == self.window else self.rows[:self.size]
+        r_sup = RankSupport(data.T, self.attr_cols, self.equal)
+        self.tracked = dict()
+        for gp in lst_gp:
+            key = tuple(gp.get_tuples())
+            self.tracked[key] = [gp, r_sup.count_pattern([list(gi) for gi in key])]
+
+    def get_patterns(self):
+        # tracked patterns that reach the minimum support in the current window
+        lst_gp = list()
+        n_pairs = self.n_pairs
+        for gp, count in self.tracked.values():
+            supp = (count / n_pairs) if n_pairs > 0 else 0
+            gp.set_support(supp)
+            if supp >= self.thd_supp:
+                lst_gp.append(gp)
+        return lst_gp
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""
+@author: "Dickson Owuor"
+@credits: "Anne Laurent"
+@license: "MIT"
+@version: "1.0"
+@email: "owuordickson@gmail.com"
+@created: "18 October 2026"
+
+Sparse bins for gradual items with few ordered tuple pairs (mostly constant
+attributes). A bin is the sorted list of the ids (i * n + j) of its pairs, so
+it takes 8 bytes per pair instead of n * n / 8 bytes. Sparse bins are joined
+with sparse bins by merging the lists, and with packed or dense bins by looking
+up their pairs, so that a join is never larger than the sparse bin.
+
+Changes
+-------
+1. Builds the pair ids of a binary rank from the sorted column (no n x n
+   comparison) and joins them with sparse, packed and dense bins
+2. Bins of distinct rows with multiplicities (weights), see packed_bin.py
+3. The transposed bin (decrement item) is sorted once and shared by a bin and
+   its transpose (T). SPARSE_DENSITY follows from the memory of a packed bin:
+   pairs take less memory than a packed bin below a density of 1/64, that is a
+   support below about 3%, so sparse bins only appear with a lower min_sup
+
+"""
+
+import numpy as np
+
+from .packed_bin import PackedBin
+from .dense_bin import DenseBin
+
+
+# Density (pairs / n^2) below which a bin is kept sparse: 8 bytes per pair against n^2 / 8 bytes for a packed
+# bin. A support is about twice the density (pairs / (n(n - 1) / 2)), so only items of support below 2/64 (~3%)
+# are kept sparse, and only if min_sup lets them through
+SPARSE_DENSITY = 1.0 / 64
+
+
+class SparseBin:
+
+    def __init__(self, pair_ids, n, weights=None, flipped=None):
+        self.pair_ids = pair_ids  # sorted ids i * n + j of the pairs (i, j) in the bin
+        self.size = n
+        self.weights = weights  # multiplicity of each row (or None)
+        self.flipped = flipped  # transposed bin, sorted once by T (and pointing back to this bin)
+
+    def __and__(self, other):
+        if isinstance(other, SparseBin):
+            pair_ids = np.intersect1d(self.pair_ids, other.pair_ids, assume_unique=True)
+        elif not isinstance(other, (PackedBin, DenseBin)):
+            return NotImplemented
+        else:
+            rows, cols = np.divmod(self.pair_ids, self.size)
+            pair_ids = self.pair_ids[SparseBin.lookup(other, rows, cols)]
+        return SparseBin(pair_ids, self.size, self.weights)
+
+    # packed & sparse (or dense & sparse) is a sparse bin as well
+    __rand__ = __and__
+
+    @property
+    def T(self):
+        if self.flipped is None:
+            rows, cols = np.divmod(self.pair_ids, self.size)
+            self.flipped = SparseBin(np.sort(cols * self.size + rows), self.size, self.weights, self)
+        return self.flipped
+
+    @property
+    def nbytes(self):
+        # with the transposed ids once T is used (as PackedBin)
+        if self.flipped is None:
+            return self.pair_ids.nbytes
+        return self.pair_ids.nbytes + self.flipped.pair_ids.nbytes
+
+    def count_and(self, other):
+        return (self & other).count()
+
+    def count(self):
+        if self.weights is None:
+            return int(self.pair_ids.size)
+        # a pair (a, a) stands for w[a] * (w[a] - 1) tuple pairs
+        rows, cols = np.divmod(self.pair_ids, self.size)
+        w = self.weights.astype(np.int64)
+        return int(np.dot(w[rows], w[cols]) - np.sum(w[rows[rows == cols]]))
+
+    def copy(self):
+        return SparseBin(self.pair_ids.copy(), self.size, self.weights)
+
+    def unpack(self):
+        bool_data = np.zeros((self.size, self.size), dtype=bool)
+        rows, cols = np.divmod(self.pair_ids, self.size)
+        bool_data[rows, cols] = True
+        return bool_data
+
+    @staticmethod
+    def bin_rank(col_data, equal=False, weights=None):
+        # pairs (i, j) with col_data[j] < col_data[i] (or <=), from the sorted column in O(n log n + pairs).
+        # With weights (distinct rows), the diagonal is kept: equal rows are ordered both ways
+        n = col_data.size
+        rows = np.flatnonzero(~np.isnan(col_data))
+        order = np.argsort(col_data[rows], kind='stable')
+        rows = rows[order]
+        values = col_data[rows]
+        # row at sorted position p is paired with the rows at positions [0, lows[p])
+        lows = np.searchsorted(values, values, side=('right' if equal else 'left'))
+        total = int(np.sum(lows))
+        starts = np.repeat(np.cumsum(lows) - lows, lows)
+        cols = rows[np.arange(total) - starts]
+        rows = np.repeat(rows, lows)
+        if equal and (weights is None):
+            keep = rows != cols
+            rows, cols = rows[keep], cols[keep]
+        return SparseBin(np.sort(rows * n + cols), n, weights)
+
+    @staticmethod
+    def lookup(other, rows, cols):
+        # mask of the pairs (rows, cols) that are in a packed or dense bin
+        if isinstance(other, DenseBin):
+            return np.asarray(other.bin_data[rows, cols], dtype=bool)
+        if isinstance(other, PackedBin):
+            if other.transposed:
+                rows, cols = cols, rows
+            packed = np.asarray(other.bin_data[rows, cols // 8])
+            return ((packed >> (7 - (cols % 8)).astype(np.uint8)) & 1).astype(bool)
+        return np.asarray(other.unpack()[rows, cols], dtype=bool)
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""
+@author: "Dickson Owuor"
+@credits: "Anne Laurent"
+@license: "MIT"
+@version: "1.0"
+@email: "owuordickson@gmail.com"
+@created: "18 October 2026"
+
+Small random tables with ties and missing (NaN) values, gradual patterns over
+their columns and a brute-force count of the tuple pairs of a pattern, shared
+by the support tests.
+
+"""
+
+import itertools
+import numpy as np
+
+from pkg_algorithms.shared.gp import GI, GP
+
+
+def make_table(seed, rows=14, cols=4, nan_rate=0.1):
+    # small integers (many ties), duplicated rows and a few missing values
+    rng = np.random.default_rng(seed)
+    data = rng.integers(0, 4, size=(rows, cols)).astype(float)
+    data[rows // 2:rows // 2 + 3] = data[0]
+    data[rng.random((rows, cols)) < nan_rate] = np.nan
+    return data
+
+
+def make_patterns(cols, size):
+    # every pattern of size items on distinct attributes, the first item increasing
+    lst_gp = list()
+    for attrs in itertools.combinations(range(cols), size):
+        for signs in itertools.product('+-', repeat=size - 1):
+            gp = GP()
+            for col, sym in zip(attrs, ('+',) + signs):
+                gp.add_gradual_item(GI(col, sym))
+            lst_gp.append(gp)
+    return lst_gp
+
+
+def brute_force_pairs(data, gp, equal=False):
+    # ordered tuple pairs (i, j), i != j, that follow every item of gp; NaN values take part in no pair
+    count = 0
+    n = data.shape[0]
+    for i in range(n):
+        for j in range(n):
+            if i == j:
+                continue
+            ok = True
+            for gi in gp.gradual_items:
+                x_i, x_j = data[i, gi.attribute_col], data[j, gi.attribute_col]
+                if gi.symbol == '-':
+                    x_i, x_j = x_j, x_i
+                if not ((x_j <= x_i) if equal else (x_j < x_i)):
+                    ok = False
+                    break
+            if ok:
+                count += 1
+    return count
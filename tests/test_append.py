@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""
+@author: "Dickson Owuor"
+@credits: "Anne Laurent"
+@license: "MIT"
+@version: "1.0"
+@email: "owuordickson@gmail.com"
+@created: "18 October 2026"
+
+Appended rows: pair counts of tracked patterns and supports of single items,
+updated from the new tuple pairs, against a brute-force count over all rows.
+
+"""
+
+import numpy as np
+import pytest
+
+from tests.brute_force import make_table, make_patterns, brute_force_pairs
+from pkg_algorithms.shared.dataset_bfs import Dataset
+from pkg_algorithms.shared.gp import GI, GP
+
+
+@pytest.mark.parametrize('eq', [False, True])
+def test_append(eq):
+    data = make_table(4, rows=16)
+    lst_gp = make_patterns(data.shape[1], 2)
+    d_set = Dataset(np.array(data[:10]), 0.0, eq)
+    d_set.track_patterns(lst_gp)
+    d_set.append(data[10:])
+    for gp, count in d_set.tracked.values():
+        assert count == brute_force_pairs(data, gp, eq)
+
+    # bins of the old rows are dropped: no pair until they are rebuilt
+    assert d_set.count_pairs(lst_gp[0].gradual_items) == 0
+    d_set.init_gp_attributes()
+    assert d_set.count_pairs(lst_gp[0].gradual_items) == brute_force_pairs(data, lst_gp[0], eq)
+
+
+@pytest.mark.parametrize('eq', [False, True])
+def test_item_supports(eq):
+    data = make_table(5, rows=18)
+    d_set = Dataset(np.array(data[:8]), 0.0, eq)
+    for stop in (12, 13, 18):
+        d_set.append(data[d_set.row_count:stop])
+        n_pairs = stop * (stop - 1) / 2
+        for col in d_set.attr_cols:
+            gp = GP()
+            gp.add_gradual_item(GI(col, '+'))
+            assert d_set.item_pairs[col] == brute_force_pairs(data[:stop], gp, eq)
+            assert d_set.item_supports[col] == pytest.approx(d_set.item_pairs[col] / n_pairs)
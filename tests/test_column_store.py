@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""
+@author: "Dickson Owuor"
+@credits: "Anne Laurent"
+@license: "MIT"
+@version: "1.0"
+@email: "owuordickson@gmail.com"
+@created: "18 October 2026"
+
+Columnar data sets: a CSV file written as a directory of columns is opened
+(memory-mapped) with the same titles, time columns and supports.
+
+"""
+
+import os
+import numpy as np
+
+from tests.brute_force import make_patterns
+from pkg_algorithms.shared.dataset_bfs import Dataset
+from pkg_algorithms.shared.column_store import ColumnStore
+
+
+def test_column_store(tmp_path):
+    rng = np.random.default_rng(0)
+    lines = ['Date,A,B,C'] + ['2021-03-{:02d},{},{},{}'.format(1 + i, *rng.integers(0, 6, 3)) for i in range(20)]
+    f_path = tmp_path / 'data.csv'
+    f_path.write_text('\n'.join(lines) + '\n')
+    store_dir = Dataset.write_columns(str(f_path), str(tmp_path / 'columns'))
+    assert ColumnStore.is_store(store_dir) and not ColumnStore.is_store(str(f_path))
+    assert os.path.isfile(os.path.join(store_dir, 'col_3.npy'))
+
+    c_set, s_set = Dataset(str(f_path), 0.0), Dataset(store_dir, 0.0)
+    # columns are memory-mapped read-only
+    assert all(isinstance(col, np.memmap) and not col.flags.writeable for col in s_set.data.T)
+    assert list(s_set.titles) == list(c_set.titles)
+    assert list(s_set.time_cols) == list(c_set.time_cols) == [0]
+    np.testing.assert_array_equal(np.asarray(s_set.data), c_set.data)
+    np.testing.assert_array_equal(s_set.data[3], c_set.data[3])
+    np.testing.assert_array_equal(s_set.data[:, 2], c_set.data[:, 2])
+
+    lst_gp = make_patterns(4, 2)
+    for d_set in (c_set, s_set):
+        d_set.init_gp_attributes()
+    assert [s_set.count_pairs(gp.gradual_items) for gp in lst_gp] == \
+        [c_set.count_pairs(gp.gradual_items) for gp in lst_gp]
+
+    # only the selected columns are opened
+    p_set = Dataset(store_dir, 0.0, attributes=['C', 'A'])
+    assert [txt[1].decode() for txt in p_set.titles] == ['A', 'C']
+    np.testing.assert_array_equal(np.asarray(p_set.data), c_set.data[:, [1, 3]])
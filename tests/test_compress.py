@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""
+@author: "Dickson Owuor"
+@credits: "Anne Laurent"
+@license: "MIT"
+@version: "1.0"
+@email: "owuordickson@gmail.com"
+@created: "18 October 2026"
+
+Identical rows kept once with their multiplicity (compress): supports of every
+bin type against a brute-force count on the uncompressed rows. LCM rejects it.
+
+"""
+
+import os
+import sys
+import subprocess
+import numpy as np
+import pytest
+
+from tests.brute_force import make_table, make_patterns, brute_force_pairs
+from pkg_algorithms.shared.dataset_bfs import Dataset
+from pkg_algorithms.shared.mem_planner import BIN_TYPES
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+
+
+@pytest.mark.parametrize('seed', [0, 1, 2])
+@pytest.mark.parametrize('eq', [False, True])
+def test_compressed_supports(seed, eq):
+    data = make_table(seed)
+    n = data.shape[0]
+    n_pairs = n * (n - 1) / 2.0
+    lst_gp = make_patterns(data.shape[1], 2) + make_patterns(data.shape[1], 3)
+    exact = [brute_force_pairs(data, gp, eq) / n_pairs for gp in lst_gp]
+
+    d_set = Dataset(data, 0.0, eq, compress=True)
+    assert d_set.data.shape[0] < n
+    assert d_set.row_count == n == int(np.sum(d_set.weights))
+    d_set.init_gp_attributes()
+    supports, mismatches = d_set.cross_check(lst_gp)
+    assert mismatches == []
+    for bin_type in BIN_TYPES:
+        if bin_type != 'sampled':
+            assert supports[bin_type] == pytest.approx(exact), bin_type
+
+
+@pytest.mark.parametrize('alg', ['lcm', 'acolcm'])
+def test_lcm_rejects_compress(alg):
+    f_path = os.path.join(os.path.dirname(SRC_DIR), 'data', 'DATASET.csv')
+    res = subprocess.run([sys.executable, os.path.join(SRC_DIR, 'main.py'), '-a', alg, '-f', f_path, '-z'],
+                         cwd=SRC_DIR, capture_output=True, text=True)
+    assert res.returncode == 2
+    assert 'compress' in res.stderr
+    assert 'Traceback' not in res.stderr
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""
+@author: "Dickson Owuor"
+@credits: "Anne Laurent"
+@license: "MIT"
+@version: "1.0"
+@email: "owuordickson@gmail.com"
+@created: "18 October 2026"
+
+On-disk cache of preprocessed data sets (cache_dir): a second run loads the
+parsed columns, valid attributes and packed bins; a changed file misses.
+
+"""
+
+import numpy as np
+
+from tests.brute_force import make_patterns
+from pkg_algorithms.shared.dataset_bfs import Dataset
+from pkg_algorithms.shared.packed_bin import PackedBin
+
+
+def write_csv(path, data):
+    lines = ['A,B,C'] + [','.join(str(int(x)) for x in row) for row in data]
+    path.write_text('\n'.join(lines) + '\n')
+    return str(path)
+
+
+def count_all(d_set, lst_gp):
+    d_set.init_gp_attributes()
+    return [d_set.count_pairs(gp.gradual_items) for gp in lst_gp]
+
+
+def test_cache_hit(tmp_path):
+    data = np.random.default_rng(0).integers(0, 10, size=(30, 3))
+    f_path = write_csv(tmp_path / 'data.csv', data)
+    cache_dir = str(tmp_path / 'cache')
+    lst_gp = make_patterns(3, 2)
+
+    # a parsed file is saved to the cache; a cached one is memory-mapped from it
+    d_set = Dataset(f_path, 0.1, cache_dir=cache_dir)
+    assert not isinstance(d_set.data, np.memmap)
+    counts = count_all(d_set, lst_gp)
+    assert set(d_set.cache.manifest['bins']) == {0, 1, 2}
+
+    d_set = Dataset(f_path, 0.1, cache_dir=cache_dir)
+    assert isinstance(d_set.data, np.memmap)
+    np.testing.assert_array_equal(d_set.data, data)
+    assert count_all(d_set, lst_gp) == counts
+    # bins are memory-mapped from the cache
+    incr_bin = d_set.get_bin(lst_gp[0].gradual_items[0])
+    assert isinstance(incr_bin, PackedBin) and isinstance(incr_bin.bin_data, np.memmap)
+
+    # another min_sup is another entry
+    assert not isinstance(Dataset(f_path, 0.2, cache_dir=cache_dir).data, np.memmap)
+
+
+def test_cache_stale_file(tmp_path):
+    rng = np.random.default_rng(1)
+    f_path = write_csv(tmp_path / 'data.csv', rng.integers(0, 10, size=(30, 3)))
+    cache_dir = str(tmp_path / 'cache')
+    count_all(Dataset(f_path, 0.1, cache_dir=cache_dir), make_patterns(3, 2))
+
+    # same file name, new contents: the cache misses and the new rows are read
+    data = rng.integers(0, 10, size=(25, 3))
+    write_csv(tmp_path / 'data.csv', data)
+    d_set = Dataset(f_path, 0.1, cache_dir=cache_dir)
+    assert not isinstance(d_set.data, np.memmap)
+    np.testing.assert_array_equal(d_set.data, data)
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""
+@author: "Dickson Owuor"
+@credits: "Anne Laurent"
+@license: "MIT"
+@version: "1.0"
+@email: "owuordickson@gmail.com"
+@created: "18 October 2026"
+
+Tuple pairs encoded by DatasetDFS (LCM) with missing (NaN) values: a pair
+with a null value is encoded 0 and is not counted as invariant.
+
+"""
+
+import numpy as np
+import pytest
+
+from tests.brute_force import make_table
+from pkg_algorithms.shared.dataset_dfs import DatasetDFS
+
+
+@pytest.mark.parametrize('seed', [0, 1])
+def test_null_pairs(seed):
+    data = make_table(seed, nan_rate=0.2)
+    d_set = DatasetDFS(data.copy())
+    encoded = d_set.encode_data()
+    n, k = data.shape
+    assert encoded.shape == (n * (n - 1) // 2, k + 2)
+
+    costs = np.ones((k, 3), dtype=int)
+    for i, j, *items in encoded:
+        for col in range(k):
+            x_i, x_j = data[i, col], data[j, col]
+            v = col + 1
+            if x_j > x_i:
+                assert items[col] == v
+                pos, neg, inv = 1, 0, 0
+            elif x_j < x_i:
+                assert items[col] == -v
+                pos, neg, inv = 0, 1, 0
+            else:
+                # equal values, or a null value
+                assert items[col] == 0
+                pos, neg, inv = 0, 0, int(x_i == x_j)
+            costs[col] += [neg + inv, pos + inv, pos + neg]
+    np.testing.assert_array_equal(d_set.cost_matrix, costs)
+    assert np.isnan(data).any()
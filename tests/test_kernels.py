@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""
+@author: "Dickson Owuor"
+@credits: "Anne Laurent"
+@license: "MIT"
+@version: "1.0"
+@email: "owuordickson@gmail.com"
+@created: "18 October 2026"
+
+Kernels (kernels.JIT on) against the NumPy code (kernels.JIT off). Without
+Numba the kernels run as plain Python functions, so both paths are checked
+wherever the tests run.
+
+"""
+
+import numpy as np
+import pytest
+
+from tests.brute_force import make_table, make_patterns, brute_force_pairs
+from pkg_algorithms.shared import kernels
+from pkg_algorithms.shared.dataset_bfs import Dataset
+from pkg_algorithms.shared.dataset_dfs import DatasetDFS
+from pkg_algorithms.shared.packed_bin import PackedBin
+
+
+@pytest.mark.parametrize('eq', [False, True])
+@pytest.mark.parametrize('keep_diag', [False, True])
+def test_pack_rank(monkeypatch, eq, keep_diag):
+    col_data = make_table(0, rows=21, cols=1)[:, 0]
+    weights = np.ones(col_data.size, dtype=int) if keep_diag else None
+    bins = dict()
+    for jit in [False, True]:
+        monkeypatch.setattr(kernels, 'JIT', jit)
+        bins[jit] = PackedBin.bin_rank(col_data, eq, tile_rows=8, weights=weights)
+    np.testing.assert_array_equal(bins[True].bin_data, bins[False].bin_data)
+    assert PackedBin.count_bits(bins[True].bin_data) == np.sum(bins[False].unpack())
+
+
+@pytest.mark.parametrize('bin_type', ['packed', 'dense'])
+@pytest.mark.parametrize('eq', [False, True])
+def test_supports(monkeypatch, bin_type, eq):
+    data = make_table(1)
+    lst_gp = make_patterns(data.shape[1], 2) + make_patterns(data.shape[1], 3)
+    counts = dict()
+    for jit in [False, True]:
+        monkeypatch.setattr(kernels, 'JIT', jit)
+        d_set = Dataset(data, 0.0, eq, bin_type=bin_type, sparse_density=0)
+        d_set.init_gp_attributes()
+        counts[jit] = [d_set.count_pairs(gp.gradual_items) for gp in lst_gp]
+    assert counts[True] == counts[False] == [brute_force_pairs(data, gp, eq) for gp in lst_gp]
+
+
+def test_encode_pairs(monkeypatch):
+    data = make_table(2, nan_rate=0.2)
+    results = dict()
+    for jit in [False, True]:
+        monkeypatch.setattr(kernels, 'JIT', jit)
+        d_set = DatasetDFS(data.copy())
+        results[jit] = (d_set.encode_data(), d_set.cost_matrix)
+    np.testing.assert_array_equal(results[True][0], results[False][0])
+    np.testing.assert_array_equal(results[True][1], results[False][1])
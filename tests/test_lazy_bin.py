@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""
+@author: "Dickson Owuor"
+@credits: "Anne Laurent"
+@license: "MIT"
+@version: "1.0"
+@email: "owuordickson@gmail.com"
+@created: "18 October 2026"
+
+Lazy bins (bin_type='lazy'): supports against a brute-force count while bins
+are evicted from the LRU cache and built again.
+
+"""
+
+import numpy as np
+import pytest
+
+from tests.brute_force import make_table, make_patterns, brute_force_pairs
+from pkg_algorithms.shared.dataset_bfs import Dataset
+from pkg_algorithms.shared.lazy_bin import BinLRU
+from pkg_algorithms.shared.packed_bin import PackedBin
+
+
+@pytest.mark.parametrize('eq', [False, True])
+def test_lazy_bins(eq):
+    data = make_table(3)
+    lst_gp = make_patterns(data.shape[1], 2)
+    exact = [brute_force_pairs(data, gp, eq) for gp in lst_gp]
+
+    # one cached bin at a time: bins are evicted and built again
+    d_set = Dataset(data, 0.0, eq, bin_type='lazy', lru_bytes=1)
+    d_set.init_gp_attributes()
+    assert [d_set.count_pairs(gp.gradual_items) for gp in lst_gp] == exact
+    assert len(d_set.bin_lru.bins) == 1
+    assert d_set.bin_lru.builds > len(d_set.attr_cols)
+
+
+def test_lru_budget():
+    data = np.random.default_rng(0).random((64, 3))
+    bin_lru = BinLRU(lambda col: PackedBin.bin_rank(data[:, col]), max_bytes=2 * 64 * 8)
+    bin_lru.get(0)
+    bin_lru.get(1)
+    bin_lru.get(0)
+    assert list(bin_lru.bins.keys()) == [1, 0] and bin_lru.builds == 2
+    # the least recently used bin (1) is evicted
+    bin_lru.get(2)
+    assert list(bin_lru.bins.keys()) == [0, 2] and bin_lru.builds == 3
+    # a cached bin with its transpose laid out counts twice
+    bin_lru.get(0) & bin_lru.get(2).T
+    bin_lru.get(1)
+    assert list(bin_lru.bins.keys()) == [1] and bin_lru.nbytes == 64 * 8
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""
+@author: "Dickson Owuor"
+@credits: "Anne Laurent"
+@license: "MIT"
+@version: "1.0"
+@email: "owuordickson@gmail.com"
+@created: "18 October 2026"
+
+Bin types chosen by the memory-budget planner: the cheapest type that fits
+with bin_type='auto', and the requested type (or a MemoryError) otherwise.
+
+"""
+
+import numpy as np
+import pytest
+
+from pkg_algorithms.shared.dataset_bfs import Dataset
+from pkg_algorithms.shared.mem_planner import MemPlanner
+
+
+def test_costs():
+    planner = MemPlanner('1G')
+    small, large = planner.estimate_costs(2000, 2000, 4), planner.estimate_costs(200000, 200000, 4)
+    assert min(small, key=small.get) == 'packed'
+    assert min(large, key=large.get) == 'rank'
+    assert large['memmap'] > large['packed']
+
+
+def test_choose():
+    n, k = 50000, 4
+    planner = MemPlanner('1G')
+    estimates = planner.estimate(n, n, k, k, 10000)
+    costs = planner.estimate_costs(n, n, k)
+    # packed bins need more than 1 GB; rank supports are cheaper than on-disk (memmap) bins
+    assert estimates['packed'][0] > planner.mem_budget
+    assert planner.choose(estimates, costs) == 'rank'
+    assert planner.choose(estimates, costs, 'blocked') == 'blocked'
+    with pytest.raises(MemoryError):
+        planner.choose(estimates, costs, 'packed')
+
+
+def test_dataset_plan():
+    data = np.random.default_rng(0).random((400, 3))
+    assert Dataset(data, 0.0, bin_type='auto').bin_type == 'packed'
+    assert Dataset(data, 0.0, bin_type='auto', mem_budget='1G').bin_type == 'packed'
+    # 400 rows of 3 attributes: packed bins need about 480 KB, rank supports about 40 KB
+    assert Dataset(data, 0.0, bin_type='auto', mem_budget='64K').bin_type == 'rank'
+    assert Dataset(data, 0.0, bin_type='blocked', mem_budget='1G').bin_type == 'blocked'
+    with pytest.raises(MemoryError):
+        Dataset(data, 0.0, bin_type='packed', mem_budget='64K')
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""
+@author: "Dickson Owuor"
+@credits: "Anne Laurent"
+@license: "MIT"
+@version: "1.0"
+@email: "owuordickson@gmail.com"
+@created: "18 October 2026"
+
+Joins of packed bins of either orientation, checked against their unpacked
+(boolean) matrices, and the in-memory transpose that a mixed join lays out
+once per bin.
+
+"""
+
+import itertools
+import numpy as np
+import pytest
+
+from pkg_algorithms.shared.packed_bin import PackedBin
+
+
+@pytest.mark.parametrize('n', [1, 7, 8, 21, 64, 70])
+def test_transpose_rows(n):
+    rng = np.random.default_rng(n)
+    bool_data = rng.random((n, n)) < 0.5
+    bin_data = np.packbits(bool_data, axis=1)
+    for start in range(0, n, 8):
+        stop = min(n, start + 16)
+        rows = np.unpackbits(PackedBin.transpose_rows(bin_data, n, start, stop), axis=1, count=n)
+        assert np.array_equal(rows.astype(bool), bool_data.T[start:stop])
+
+
+@pytest.mark.parametrize('n', [13, 40])
+def test_mixed_joins(n):
+    rng = np.random.default_rng(n)
+    a_bin = PackedBin.bin_rank(rng.integers(0, 5, n).astype(float), tile_rows=8)
+    b_bin = PackedBin.bin_rank(rng.integers(0, 5, n).astype(float), tile_rows=8)
+    for x_bin, y_bin in itertools.product([a_bin, a_bin.T], [b_bin, b_bin.T]):
+        bool_data = x_bin.unpack() & y_bin.unpack()
+        assert np.array_equal((x_bin & y_bin).unpack(), bool_data)
+        assert x_bin.count_and(y_bin) == int(np.sum(bool_data))
+
+
+def test_transpose_laid_out_once(monkeypatch):
+    # a mixed join transposes each tile of the bin once; later mixed joins cost as much as same-sign joins
+    n = 40
+    rng = np.random.default_rng(0)
+    col_bins = [PackedBin.bin_rank(rng.random(n), tile_rows=8) for _ in range(3)]
+    calls = list()
+    transpose_rows = PackedBin.transpose_rows
+
+    def count_calls(bin_data, size, start, stop):
+        calls.append(start)
+        return transpose_rows(bin_data, size, start, stop)
+
+    monkeypatch.setattr(PackedBin, 'transpose_rows', staticmethod(count_calls))
+    for _ in range(2):
+        col_bins[0] & col_bins[1].T
+        col_bins[2] & col_bins[1].T
+        col_bins[0].T.count_and(col_bins[2])
+    assert sorted(calls) == sorted(2 * list(range(0, n, 8)))
+    assert col_bins[1].nbytes == 2 * col_bins[1].bin_data.nbytes
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+@author: "Dickson Owuor"
+@credits: "Anne Laurent"
+@license: "MIT"
+@version: "1.0"
+@email: "owuordickson@gmail.com"
+@created: "18 October 2026"
+
+CSV files parsed into float columns: detected delimiter and headers, time
+columns as epoch seconds and invalid entries as missing (NaN) values.
+
+"""
+
+import time
+from datetime import datetime
+import numpy as np
+import pytest
+
+from pkg_algorithms.shared.dataset_bfs import Dataset
+
+
+def write_csv(path, lines):
+    path.write_text('\n'.join(lines) + '\n')
+    return str(path)
+
+
+def test_read_csv(tmp_path):
+    f_path = write_csv(tmp_path / 'data.csv', ['Date;Age;Weight', '2020-01-05;30;70.5', '2020-01-03;?;80',
+                                               '2020-01-04;25;abc'])
+    titles, data, time_cols = Dataset.read_csv(f_path)
+    assert [txt[1].decode() for txt in titles] == ['Date', 'Age', 'Weight']
+    assert data.dtype == np.float64 and data.shape == (3, 3)
+    assert list(time_cols) == [0]
+    assert data[0, 0] == time.mktime(datetime(2020, 1, 5).timetuple())
+    assert data[1, 0] - data[2, 0] == -86400
+    np.testing.assert_array_equal(data[:, 1:], [[30, 70.5], [np.nan, 80], [25, np.nan]])
+
+
+def test_read_csv_no_header(tmp_path):
+    f_path = write_csv(tmp_path / 'data.csv', ['1,2.5,3', '4,5,6', '7,8,9'])
+    titles, data, time_cols = Dataset.read_csv(f_path)
+    assert titles.size == 0 and time_cols.size == 0
+    np.testing.assert_array_equal(data, [[1, 2.5, 3], [4, 5, 6], [7, 8, 9]])
+
+    d_set = Dataset(f_path, 0.5)
+    assert (d_set.row_count, d_set.col_count) == (3, 3)
+    assert list(d_set.attr_cols) == [0, 1, 2]
+
+
+def test_read_csv_chunks(tmp_path):
+    lines = ['Date,Age,Weight'] + ['2020-01-{:02d},{},{}'.format(1 + i % 28, i % 7, ('?' if i % 5 == 0 else i))
+                                   for i in range(23)]
+    f_path = write_csv(tmp_path / 'data.csv', lines)
+    titles, data, time_cols = Dataset.read_csv(f_path)
+    for chunk_rows in [1, 4, 23, 100]:
+        c_titles, c_data, c_time_cols = Dataset.read_csv(f_path, chunk_rows=chunk_rows, scratch_dir=str(tmp_path))
+        # rows are appended to an on-disk array, chunk by chunk
+        assert isinstance(c_data, np.memmap)
+        np.testing.assert_array_equal(c_data, data)
+        assert list(c_titles) == list(titles) and list(c_time_cols) == list(time_cols)
+
+
+def test_read_csv_columns(tmp_path):
+    f_path = write_csv(tmp_path / 'data.csv', ['Date,Age,Weight,Height', '2020-01-05,30,70.5,180',
+                                               '2020-01-03,20,80,170', '2020-01-04,25,75,175'])
+    titles, data, time_cols = Dataset.read_csv(f_path)
+    # by header name or by index, in file order
+    for attributes in [['Height', 'Age'], ['3', '1'], ['Height', 1]]:
+        p_titles, p_data, p_time_cols = Dataset.read_csv(f_path, attributes=attributes)
+        assert [txt[1].decode() for txt in p_titles] == ['Age', 'Height']
+        np.testing.assert_array_equal(p_data, data[:, [1, 3]])
+        assert p_time_cols.size == 0
+    p_titles, p_data, p_time_cols = Dataset.read_csv(f_path, attributes=['Date', 'Weight'])
+    np.testing.assert_array_equal(p_data, data[:, [0, 2]])
+    assert list(p_time_cols) == [0]
+
+    d_set = Dataset(f_path, 0.5, attributes=['Weight', 'Age'])
+    assert d_set.col_count == 2 and list(d_set.attr_cols) == [0, 1]
+    with pytest.raises(Exception, match='unknown attribute'):
+        Dataset.read_csv(f_path, attributes=['Speed'])
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""
+@author: "Dickson Owuor"
+@credits: "Anne Laurent"
+@license: "MIT"
+@version: "1.0"
+@email: "owuordickson@gmail.com"
+@created: "18 October 2026"
+
+In-memory inputs: float arrays and DataFrames wrapped without a copy, and
+mixed DataFrames converted as a CSV file would be (even with no attribute
+column).
+
+"""
+
+import numpy as np
+import pandas as pd
+
+from tests.brute_force import make_table
+from pkg_algorithms.shared.dataset_bfs import Dataset
+from pkg_algorithms.shared.gp import GI
+
+
+def test_zero_copy():
+    data = make_table(0)
+    d_set = Dataset(data, 0.0)
+    assert d_set.data is data or np.shares_memory(d_set.data, data)
+
+    frame = pd.DataFrame(data, columns=['A', 'B', 'C', 'D'])
+    d_set = Dataset(frame, 0.0)
+    assert np.shares_memory(d_set.data, frame.to_numpy(copy=False))
+    assert [txt[1].decode() for txt in d_set.titles] == ['A', 'B', 'C', 'D']
+    np.testing.assert_array_equal(d_set.data, data)
+
+
+def test_frame_like_csv(tmp_path):
+    f_path = tmp_path / 'data.csv'
+    f_path.write_text('Date,Age,Weight\n2020-01-05,30,70.5\n2020-01-03,?,80\n2020-01-04,25,60\n2020-01-01,22,65\n')
+    frame = pd.DataFrame({'Date': pd.to_datetime(['2020-01-05', '2020-01-03', '2020-01-04', '2020-01-01']),
+                          'Age': ['30', '?', '25', '22'], 'Weight': [70.5, 80, 60, 65]})
+    c_set, f_set = Dataset(str(f_path), 0.0), Dataset(frame, 0.0)
+    assert list(f_set.time_cols) == list(c_set.time_cols) == [0]
+    np.testing.assert_array_equal(f_set.data, c_set.data)
+    # the caller's table is left as it was
+    assert list(frame['Age']) == ['30', '?', '25', '22']
+
+    for d_set in (c_set, f_set):
+        assert list(d_set.attr_cols) == [1, 2]
+        d_set.init_gp_attributes()
+    for sym in '+-':
+        gi_list = [GI(1, '+'), GI(2, sym)]
+        assert f_set.count_pairs(gi_list) == c_set.count_pairs(gi_list) > 0
+
+
+def test_time_cols_only():
+    # no attribute to bin: no bins, whatever the number of threads
+    frame = pd.DataFrame({'Date': pd.to_datetime(['2020-01-05', '2020-01-03', '2020-01-04', '2020-01-01'])})
+    for bin_type in ('packed', 'rank'):
+        d_set = Dataset(frame, 0.0, bin_type=bin_type, n_jobs=2)
+        assert len(d_set.attr_cols) == 0
+        d_set.init_gp_attributes()
+        assert d_set.no_bins and len(d_set.valid_bins) == 0
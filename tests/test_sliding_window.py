@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+@author: "Dickson Owuor"
+@credits: "Anne Laurent"
+@license: "MIT"
+@version: "1.0"
+@email: "owuordickson@gmail.com"
+@created: "18 October 2026"
+
+Sliding windows: pair counts of tracked patterns against a brute-force count
+of the last W rows, the bins of the mined windows and the options a window
+forwards or rejects.
+
+"""
+
+import os
+import sys
+import subprocess
+import numpy as np
+import pytest
+
+from tests.brute_force import make_table, make_patterns, brute_force_pairs
+from pkg_algorithms import graank_v2
+from pkg_algorithms.shared.sliding_window import SlidingWindow
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+
+
+@pytest.mark.parametrize('eq', [False, True])
+def test_sliding_window(eq):
+    data = make_table(5, rows=20)
+    window = 8
+    lst_gp = make_patterns(data.shape[1], 2)
+    s_win = SlidingWindow(window, 0.0, np.arange(data.shape[1]), eq)
+    for row in data[:window]:
+        s_win.push(row)
+    s_win.track_patterns(lst_gp)
+    for r in range(window, data.shape[0]):
+        s_win.push(data[r])
+        for gp, count in s_win.tracked.values():
+            assert count == brute_force_pairs(data[(r + 1 - window):(r + 1)], gp, eq)
+
+
+def test_window_bins():
+    data = make_table(6, rows=8, cols=3, nan_rate=0.0)
+    for bin_type, expected in [('auto', 'rank'), ('packed', 'packed'), ('blocked', 'blocked')]:
+        s_win = None
+        for s_win in graank_v2.graank_stream(data, 0.5, 6, np.arange(data.shape[1]), bin_type=bin_type):
+            pass
+        assert s_win.get_dataset().bin_type == expected
+    # the budget holds every mined window
+    with pytest.raises(MemoryError):
+        for _ in graank_v2.graank_stream(data, 0.5, 6, np.arange(data.shape[1]), bin_type='packed',
+                                         mem_budget=64):
+            pass
+
+
+def test_window_options():
+    f_path = os.path.join(os.path.dirname(SRC_DIR), 'data', 'DATASET.csv')
+    with pytest.raises(Exception, match='sliding window'):
+        graank_v2.init(f_path, 0.5, 1, window=5, compress=True)
+    res = subprocess.run([sys.executable, os.path.join(SRC_DIR, 'main.py'), '-a', 'graank', '-f', f_path,
+                          '-n', '5', '-r'], cwd=SRC_DIR, capture_output=True, text=True)
+    assert res.returncode == 2 and 'window' in res.stderr
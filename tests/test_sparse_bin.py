@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""
+@author: "Dickson Owuor"
+@credits: "Anne Laurent"
+@license: "MIT"
+@version: "1.0"
+@email: "owuordickson@gmail.com"
+@created: "18 October 2026"
+
+Sparse bins: supports against a brute-force count when every bin is sparse,
+and the transposed bin, which is sorted once and shared with its transpose.
+
+"""
+
+import numpy as np
+import pytest
+
+from tests.brute_force import make_table, make_patterns, brute_force_pairs
+from pkg_algorithms.shared.dataset_bfs import Dataset
+from pkg_algorithms.shared.sparse_bin import SparseBin
+
+
+@pytest.mark.parametrize('eq', [False, True])
+def test_sparse_bins(eq):
+    data = make_table(3)
+    lst_gp = make_patterns(data.shape[1], 2)
+    exact = [brute_force_pairs(data, gp, eq) for gp in lst_gp]
+
+    # every bin sparse
+    d_set = Dataset(data, 0.0, eq, sparse_density=1.0)
+    d_set.init_gp_attributes()
+    assert [d_set.count_pairs(gp.gradual_items) for gp in lst_gp] == exact
+
+
+def test_transpose_sorted_once():
+    col_data = make_table(6)[:, 0]
+    s_bin = SparseBin.bin_rank(col_data)
+    t_bin = s_bin.T
+    assert np.array_equal(t_bin.unpack(), s_bin.unpack().T)
+    assert np.all(np.diff(t_bin.pair_ids) > 0)
+    assert s_bin.nbytes == t_bin.nbytes == 2 * s_bin.pair_ids.nbytes
+
+    # later transposes return the same bins
+    assert s_bin.T is t_bin and t_bin.T is s_bin
+    assert s_bin.T.T is s_bin
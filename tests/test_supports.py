@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""
+@author: "Dickson Owuor"
+@credits: "Anne Laurent"
+@license: "MIT"
+@version: "1.0"
+@email: "owuordickson@gmail.com"
+@created: "18 October 2026"
+
+Supports of every bin type, checked against a brute-force count of tuple
+pairs on small random tables with ties and missing (NaN) values.
+
+"""
+
+import pytest
+
+from tests.brute_force import make_table, make_patterns, brute_force_pairs
+from pkg_algorithms.shared.dataset_bfs import Dataset
+from pkg_algorithms.shared.mem_planner import BIN_TYPES
+
+
+@pytest.mark.parametrize('seed', [0, 1, 2])
+@pytest.mark.parametrize('eq', [False, True])
+def test_bin_types_agree(seed, eq):
+    data = make_table(seed)
+    n = data.shape[0]
+    n_pairs = n * (n - 1) / 2.0
+    lst_gp = make_patterns(data.shape[1], 2) + make_patterns(data.shape[1], 3)
+    exact = [brute_force_pairs(data, gp, eq) / n_pairs for gp in lst_gp]
+
+    d_set = Dataset(data, 0.0, eq)
+    d_set.init_gp_attributes()
+    supports, mismatches = d_set.cross_check(lst_gp)
+    assert set(supports.keys()) == set(BIN_TYPES)
+    assert mismatches == []
+    for bin_type in BIN_TYPES:
+        if bin_type != 'sampled':
+            assert supports[bin_type] == pytest.approx(exact), bin_type
+
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+@author: "Dickson Owuor"
+@credits: "Anne Laurent"
+@license: "MIT"
+@version: "1.0"
+@email: "owuordickson@gmail.com"
+@created: "18 October 2026"
+
+Date-time columns: the format of a column whose sample is ambiguous (day and
+month order), and epoch seconds of local times that a daylight saving change
+repeats or skips, as time.mktime() reads them.
+
+"""
+
+from datetime import datetime
+import time
+import numpy as np
+import pandas as pd
+import pytest
+
+from pkg_algorithms.shared.dataset_bfs import Dataset
+
+
+def test_ambiguous_format(capsys):
+    # every day of the sample is at most 12; a later value is day-first only
+    dates = ['0' + str(d) + '/0' + str(m) + '/2020' for d in range(1, 10) for m in range(1, 10)] + ['25/01/2020']
+    assert Dataset.infer_time_format(dates, sample_size=20) == '%d/%m/%Y'
+    # month-first is read (and reported) when no value decides
+    assert Dataset.infer_time_format(dates[:-1], sample_size=20) == '%m/%d/%Y'
+    assert 'Ambiguous' in capsys.readouterr().out
+    assert Dataset.infer_time_format(['12/25/2020', '01/02/2020']) == '%m/%d/%Y'
+
+
+@pytest.fixture
+def paris_time(monkeypatch):
+    if not hasattr(time, 'tzset'):
+        pytest.skip('time.tzset() is not available')
+    monkeypatch.setenv('TZ', 'Europe/Paris')
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+def test_dst_times(paris_time):
+    # 02:30 is repeated on 31 October 2021 and skipped on 28 March 2021
+    texts = ['2021-10-31 02:30:00', '2021-03-28 02:30:00', '2021-06-01 12:00:00']
+    date_times = pd.to_datetime(pd.Series(texts), format='%Y-%m-%d %H:%M:%S')
+    t_stamps = Dataset.epoch_seconds(date_times)
+    assert not np.any(np.isnan(t_stamps))
+    expected = [time.mktime(datetime.strptime(x, '%Y-%m-%d %H:%M:%S').timetuple()) for x in texts]
+    assert np.array_equal(t_stamps, expected)